@@ -1,8 +1,14 @@
 from loguru import logger
 import asyncio
-from typing import Dict, Tuple, Set, Optional, ClassVar, Iterable, Union
+import operator
+import sys
+import types
+import weakref
+from bisect import bisect_left, insort
+from typing import (
+    Dict, Tuple, List, Set, Optional, ClassVar, Iterable, Union, Callable,
+)
 
-from pydispatch import Dispatcher
 from tslumd import Screen, Tally, TallyColor, TallyKey, TallyType
 
 from .common import (
@@ -12,16 +18,19 @@ from .config import Option
 
 __all__ = ('BaseIO', 'BaseInput', 'BaseOutput')
 
-class BaseIO(Dispatcher):
+_MISSING = object()
+
+class BaseIO:
     """Base class for tally inputs and outputs
 
     Arguments:
         config: The initial value for :attr:`config`
     """
 
-    config: TallyConfig
-    """The output tally configuration
-    """
+    __slots__ = (
+        '_config', 'running', '_BaseIO__id', '_loop',
+        '_config_matches', '_config_matches_screen',
+    )
 
     running: bool
     """``True`` if the display is running
@@ -61,31 +70,42 @@ class BaseIO(Dispatcher):
     """
 
     __subclass_map: ClassVar[Dict[str, 'BaseIO']] = {}
+    __sorted_namespaces: ClassVar[List[str]] = []
 
     def __init_subclass__(cls, namespace=None, final=False, **kwargs):
         if namespace is None:
             return
-        cls_namespace = None
-        for basecls in cls.mro():
-            if basecls is cls:
-                continue
-            elif basecls is BaseIO:
+        cls_namespace = namespace
+        for basecls in cls.__bases__:
+            parent_ns = getattr(basecls, 'namespace', _MISSING)
+            if parent_ns is not _MISSING:
+                cls_namespace = parent_ns + '.' + namespace
                 break
-            if hasattr(basecls, 'namespace'):
-                cls_namespace = f'{basecls.namespace}.{namespace}'
-                break
-        if cls_namespace is None:
-            cls_namespace = namespace
+        cls_namespace = sys.intern(cls_namespace)
         cls.namespace = cls_namespace
         if final:
-            assert cls_namespace not in BaseIO._BaseIO__subclass_map
-            BaseIO._BaseIO__subclass_map[cls_namespace] = cls
+            subclass_map = BaseIO._BaseIO__subclass_map
+            if subclass_map.setdefault(cls_namespace, cls) is not cls:
+                raise ValueError(f'namespace "{cls_namespace}" already exists')
+            insort(BaseIO._BaseIO__sorted_namespaces, cls_namespace)
 
     def __init__(self, config: TallyConfig):
         self.__id = None
+        self._loop = None
         self.config = config
         self.running = False
 
+    @property
+    def config(self) -> TallyConfig:
+        """The tally configuration
+        """
+        return self._config
+    @config.setter
+    def config(self, value: TallyConfig):
+        self._config = value
+        self._config_matches = value.matches
+        self._config_matches_screen = value.matches_screen
+
     @property
     def id(self) -> Optional[str]:
         """Unique identifier when added as a member of :class:`.manager.IOContainer`
@@ -104,19 +124,21 @@ class BaseIO(Dispatcher):
     def get_class_for_namespace(cls, namespace: str) -> 'BaseIO':
         """Get the :class:`BaseIO` subclass matching the given :attr:`namespace`
         """
-        if cls is not BaseIO:
-            return BaseIO.get_class_for_namespace(namespace)
-        return cls.__subclass_map[namespace]
+        return BaseIO._BaseIO__subclass_map[namespace]
 
     @classmethod
     def get_all_namespaces(cls, prefix: Optional[str] = '') -> Iterable[str]:
         """Get all currently available :attr:`namespaces <namespace>`
         """
-        if cls is not BaseIO:
-            return BaseIO.get_all_namespaces(namespace)
-        for ns in sorted(cls.__subclass_map.keys()):
-            if ns.startswith(prefix):
-                yield ns
+        namespaces = BaseIO._BaseIO__sorted_namespaces
+        if not prefix:
+            yield from namespaces
+            return
+        # All names starting with the prefix sort contiguously from here
+        for ns in namespaces[bisect_left(namespaces, prefix):]:
+            if not ns.startswith(prefix):
+                break
+            yield ns
 
     @classmethod
     def get_init_options(cls) -> Tuple[Option]:
@@ -124,6 +146,39 @@ class BaseIO(Dispatcher):
         """
         return (Option(name='config', type=TallyConfig, required=True),)
 
+    @classmethod
+    def _get_cached_init_options(cls) -> Tuple[Option]:
+        """Get the result of :meth:`get_init_options`, creating it only once
+        per class
+        """
+        opts = cls.__dict__.get('_init_options_cache')
+        if opts is None:
+            opts = cls.get_init_options()
+            cls._init_options_cache = opts
+        return opts
+
+    @classmethod
+    def _get_option_callbacks(
+        cls
+    ) -> Tuple[Dict[str, Callable], Tuple[Tuple[str, Callable, Callable], ...]]:
+        """Get a mapping of option names to their :meth:`~.config.Option.validate`
+        methods and a tuple of ``(name, attrgetter, serialize)`` for each option,
+        creating them only once per class
+        """
+        cbs = cls.__dict__.get('_option_callbacks_cache')
+        if cbs is None:
+            opts = cls._get_cached_init_options()
+            serializers = {
+                opt.name: (opt.name, operator.attrgetter(opt.name), opt.serialize)
+                for opt in opts
+            }
+            cbs = (
+                {opt.name: opt.validate for opt in opts},
+                tuple(serializers.values()),
+            )
+            cls._option_callbacks_cache = cbs
+        return cbs
+
     @classmethod
     def create_from_options(cls, values: Dict) -> 'BaseIO':
         """Create an instance using definitions from :meth:`get_init_options`
@@ -133,11 +188,11 @@ class BaseIO(Dispatcher):
             values(dict): A dict of values formatted as the result from the
                 :meth:`serialize_options` method
         """
-        kw = {}
-        for opt in cls.get_init_options():
-            if opt.name not in values:
-                continue
-            kw[opt.name] = opt.validate(values[opt.name])
+        validators = cls._get_option_callbacks()[0]
+        kw = {
+            name: validate(values[name])
+            for name, validate in validators.items() if name in values
+        }
         return cls(**kw)
 
     # @final
@@ -154,8 +209,7 @@ class BaseIO(Dispatcher):
         """Serialize the instance :meth:`values <serialize_options>` and the
         class namespace
         """
-        opt_vals = self.serialize_options()
-        return {'namespace':self.namespace, 'options':opt_vals}
+        return {'namespace':self.namespace, 'options':self.serialize_options()}
 
     def serialize_options(self) -> Dict:
         """Serialize the values defined in :meth:`get_init_options` using
@@ -166,31 +220,33 @@ class BaseIO(Dispatcher):
         :meth:`create_from_options` method
         """
         d = {}
-        for opt in self.get_init_options():
-            value = getattr(self, opt.name)
+        for name, getter, serialize in self._get_option_callbacks()[1]:
+            value = getter(self)
             if value is None:
                 continue
-            d[opt.name] = opt.serialize(value)
+            d[name] = serialize(value)
         return d
 
     async def open(self):
         """Initalize any necessary device communication
         """
+        self._loop = asyncio.get_running_loop()
         self.running = True
 
     async def close(self):
         """Close device communication
         """
         self.running = False
+        self._loop = None
 
-    def screen_matches(self, screen: Screen) -> bool:
+    def screen_matches(self, screen: Union[Screen, int]) -> bool:
         """Determine whether the given screen matches the :attr:`config`
 
         Uses either :meth:`SingleTallyConfig.matches_screen` or
         :meth:`MultiTallyConfig.matches_screen`, depending on which of the two
         are used for the :class:`BaseIO` subclass
         """
-        return self.config.matches_screen(screen)
+        return self._config_matches_screen(screen)
 
     def tally_matches(
         self,
@@ -213,13 +269,23 @@ class BaseIO(Dispatcher):
                 otherwise return the matched :class:`SingleTallyConfig` if one
                 was found.
         """
-        return self.config.matches(tally, tally_type, return_matched)
+        return self._config_matches(tally, tally_type, return_matched)
 
     async def on_receiver_tally_change(self, tally: Tally, *args, **kwargs):
         """Callback for tally updates from :class:`tslumd.tallyobj.Tally`
         """
         pass
 
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the running event loop, caching it on first use
+
+        Must be called from within a coroutine
+        """
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        return loop
+
     async def __aenter__(self):
         await self.open()
         return self
@@ -248,7 +314,114 @@ class BaseInput(BaseIO, namespace='input'):
             has been updated
     """
 
-    _events_ = ['on_screen_added', 'on_tally_added', 'on_tally_updated']
+    __slots__ = ('_event_callbacks',)
+
+    _events_ = ('on_screen_added', 'on_tally_added', 'on_tally_updated')
+
+    def __init__(self, config: TallyConfig):
+        # Callbacks for each event are stored as lists of weak references
+        # (one for functions and one for coroutine functions with their loops)
+        # rather than in pydispatch Event objects so that emitting with no
+        # listeners is a single truth test
+        self._event_callbacks = {
+            name: ([], []) for name in self._get_event_names()
+        }
+        super().__init__(config)
+
+    @classmethod
+    def _get_event_names(cls) -> Tuple[str, ...]:
+        """Get the names of all events defined with ``_events_`` in the class
+        and its bases, creating them only once per class
+        """
+        names = cls.__dict__.get('_event_names_cache')
+        if names is None:
+            names = []
+            for c in cls.__mro__:
+                for name in c.__dict__.get('_events_', ()):
+                    if name not in names:
+                        names.append(name)
+            names = tuple(names)
+            cls._event_names_cache = names
+        return names
+
+    def register_event(self, *names):
+        """Register new events after instance creation
+
+        This matches :meth:`pydispatch.dispatch.Dispatcher.register_event`
+        """
+        for name in names:
+            self._event_callbacks.setdefault(name, ([], []))
+
+    def bind(self, **kwargs):
+        """Subscribe to events using the event names as keyword arguments
+
+        This matches :meth:`pydispatch.dispatch.Dispatcher.bind`, with the
+        exception that :class:`pydispatch.properties.Property` objects are not
+        supported. Callbacks are stored as weak references.
+        """
+        loop = kwargs.pop('__aio_loop__', None)
+        for name, cb in kwargs.items():
+            callbacks, aio_callbacks = self._event_callbacks[name]
+            if asyncio.iscoroutinefunction(cb):
+                if loop is None:
+                    raise RuntimeError('Coroutine function given without event loop')
+                callbacks = aio_callbacks
+            if isinstance(cb, types.MethodType):
+                ref = weakref.WeakMethod(cb)
+            else:
+                ref = weakref.ref(cb)
+            # Drop any dead references and an existing binding of the callback
+            callbacks[:] = [
+                item for item in callbacks if item[0]() is not None and item[0] != ref
+            ]
+            callbacks.append((ref, loop))
+
+    def bind_async(self, loop: asyncio.BaseEventLoop, **kwargs):
+        """Subscribe to events with :term:`coroutine functions <coroutine function>`
+        which will be scheduled on the given loop
+
+        This matches :meth:`pydispatch.dispatch.Dispatcher.bind_async`
+        """
+        kwargs['__aio_loop__'] = loop
+        self.bind(**kwargs)
+
+    def unbind(self, *args):
+        """Unsubscribe from events using either the callbacks given to
+        :meth:`bind` or the instance object they belong to
+        """
+        for cb_lists in self._event_callbacks.values():
+            for callbacks in cb_lists:
+                if not callbacks:
+                    continue
+                keep = []
+                for item in callbacks:
+                    cb = item[0]()
+                    if cb is None:
+                        continue
+                    obj = getattr(cb, '__self__', None)
+                    if any(arg is obj or arg == cb for arg in args):
+                        continue
+                    keep.append(item)
+                callbacks[:] = keep
+
+    def emit(self, name: str, *args, **kwargs):
+        """Dispatch an event to any subscribed callbacks
+
+        As with :meth:`pydispatch.dispatch.Dispatcher.emit`, coroutine
+        functions are scheduled on their event loops first. The other
+        callbacks are then called in order until one of them returns ``False``
+        """
+        callbacks, aio_callbacks = self._event_callbacks[name]
+        if aio_callbacks:
+            for ref, loop in tuple(aio_callbacks):
+                cb = ref()
+                if cb is not None:
+                    asyncio.run_coroutine_threadsafe(cb(*args, **kwargs), loop)
+        if callbacks:
+            for ref, loop in tuple(callbacks):
+                cb = ref()
+                if cb is not None and cb(*args, **kwargs) is False:
+                    return False
 
     def get_screen(self, screen_index: int) -> Optional[Screen]:
         """Get a :class:`~tslumd.tallyobj.Screen` object by the given index
@@ -295,11 +468,15 @@ class BaseInput(BaseIO, namespace='input'):
         if not tally_conf:
             return None
         tally = self.get_tally(tally_conf.tally_key)
-        if tally is not None:
-            ttype = tally_conf.tally_type & tally_type
-            if ttype == TallyType.no_tally:
-                return None
+        if tally is None:
+            return None
+        ttype = tally_conf.tally_type & tally_type
+        if ttype == TallyType.no_tally:
+            return None
+        if ttype.is_iterable:
             return tally[ttype] & tally_conf.color_mask
+        # Single types can be read directly from the Tally attribute
+        return getattr(tally, ttype.name) & tally_conf.color_mask
 
 
 class BaseOutput(BaseIO, namespace='output'):
@@ -309,6 +486,12 @@ class BaseOutput(BaseIO, namespace='output'):
         config: The initial value for :attr:`~BaseIO.config`
     """
 
+    __slots__ = (
+        'bound_inputs', 'bound_input_tally_keys', '_input_lock', '_input_to_keys',
+    )
+
+    _INITIAL_PROPS_CHANGED: ClassVar[Tuple[str, ...]] = ('rh_tally', 'txt_tally', 'lh_tally')
+
     bound_inputs: Dict[str, BaseInput]
     """Mapping of all :class:`BaseInput` instances this object is bound to,
     stored using the :attr:`id <BaseIO.id>` as the key
@@ -316,15 +499,19 @@ class BaseOutput(BaseIO, namespace='output'):
     (see :meth:`bind_to_input`)
     """
 
-    bound_input_tally_keys: Dict[TallyKey, Set[str]]
+    bound_input_tally_keys: Dict[TallyKey, Set[BaseInput]]
+    """Mapping of :term:`TallyKey` to the :attr:`bound_inputs` containing
+    a tally bound with :meth:`bind_to_tally`
+    """
 
     def __init__(self, config: TallyConfig):
         self.bound_inputs = {}
         self.bound_input_tally_keys = {}
+        self._input_to_keys = {}
         self._input_lock = asyncio.Lock()
         super().__init__(config)
 
-    async def bind_to_input(self, inp: BaseInput):
+    async def bind_to_input(self, inp: BaseInput, tallies: Optional[Iterable[Tally]] = None):
         """Find and set up listeners for matching tallies in the
         :class:`input <BaseInput>`
 
@@ -333,23 +520,32 @@ class BaseOutput(BaseIO, namespace='output'):
         * Store the input object in :attr:`bound_inputs`
         * Binds to the :event:`BaseInput.on_tally_added` event to listen
           for new tallies.
+
+        Arguments:
+            inp: The input to bind to
+            tallies: If given, the result of :meth:`BaseInput.get_all_tallies`
+                to search instead of calling it. This allows the input's
+                tallies to be gathered once when binding multiple outputs
         """
-        loop = asyncio.get_event_loop()
-        coros = set()
+        loop = self._get_loop()
         if inp.id in self.bound_inputs:
             return
-        async with self._input_lock:
-            assert inp.id is not None
-            assert inp.id not in self.bound_inputs
-            assert inp.id not in self.bound_input_tally_keys
-            self.bound_inputs[inp.id] = inp
-            for tally in inp.get_all_tallies():
-                if not self.tally_matches(tally):
-                    continue
-                coros.add(self.bind_to_tally(inp, tally))
+        assert inp.id is not None
+        assert inp.id not in self._input_to_keys
 
-            if len(coros):
-                await asyncio.gather(*coros)
+        # Registered before any await so that concurrent calls for the same
+        # input return early above
+        self.bound_inputs[inp.id] = inp
+        async with self._input_lock:
+            # Awaited in turn rather than gathered since bind_to_tally rarely
+            # suspends and wrapping each call in a Task only adds overhead.
+            # The matches are collected first because the input's tallies
+            # may change while awaiting
+            if tallies is None:
+                tallies = inp.get_all_tallies()
+            tallies = [tally for tally in tallies if self.tally_matches(tally)]
+            for tally in tallies:
+                await self.bind_to_tally(inp, tally)
             inp.bind_async(loop, on_tally_added=self.on_tally_added)
 
     async def unbind_from_input(self, inp: BaseInput):
@@ -358,21 +554,27 @@ class BaseOutput(BaseIO, namespace='output'):
         """
         async with self._input_lock:
             inp.unbind(self)
-            for s in self.bound_input_tally_keys:
-                s.discard(inp.id)
             del self.bound_inputs[inp.id]
+            for tally_key in self._input_to_keys.pop(inp.id, ()):
+                inputs = self.bound_input_tally_keys[tally_key]
+                inputs.discard(inp)
+                if not len(inputs):
+                    del self.bound_input_tally_keys[tally_key]
             for tally in inp.get_all_tallies():
                 tally.unbind(self)
 
-    @logger.catch
     async def on_tally_added(self, inp: BaseInput, tally: Tally, **kwargs):
         if inp.id not in self.bound_inputs:
             return
-        if self.tally_matches(tally):
-            async with self._input_lock:
+        # No lock is needed here. bind_to_tally registers the tally before its
+        # first await and unbind_from_input removes the input before any
+        # tally bindings are dropped
+        try:
+            if self.tally_matches(tally):
                 await self.bind_to_tally(inp, tally)
+        except Exception:
+            logger.exception('Error handling added tally {} from {}', tally.id, inp.id)
 
-    @logger.catch
     async def bind_to_tally(self, inp: BaseInput, tally: Tally):
         """Update current state and subscribe to changes from the given
         :class:`~tslumd.tallyobj.Tally`
@@ -380,15 +582,17 @@ class BaseOutput(BaseIO, namespace='output'):
         Calls :meth:`~BaseIO.on_receiver_tally_change` and binds tally update
         events to it
         """
-
-        loop = asyncio.get_event_loop()
-        tally_key = tally.id
-        if tally_key not in self.bound_input_tally_keys:
-            self.bound_input_tally_keys[tally_key] = set()
-        self.bound_input_tally_keys[tally_key].add(inp.id)
-        tally.bind_async(loop, on_update=self.on_receiver_tally_change)
-        props_changed = ('rh_tally', 'txt_tally', 'lh_tally')
-        await self.on_receiver_tally_change(tally, props_changed=props_changed)
+        try:
+            loop = self._get_loop()
+            tally_key = tally.id
+            self.bound_input_tally_keys.setdefault(tally_key, set()).add(inp)
+            self._input_to_keys.setdefault(inp.id, set()).add(tally_key)
+            tally.bind_async(loop, on_update=self.on_receiver_tally_change)
+            await self.on_receiver_tally_change(
+                tally, props_changed=self._INITIAL_PROPS_CHANGED,
+            )
+        except Exception:
+            logger.exception('Error binding to tally {} from {}', tally.id, inp.id)
 
     def get_all_input_tallies(self, tally_key: TallyKey) -> Iterable[Tuple[BaseInput, Tally]]:
         """Get all :class:`~tslumd.tallyobj.Tally` objects in :attr:`bound_inputs`
@@ -401,9 +605,7 @@ class BaseOutput(BaseIO, namespace='output'):
         tally : Tally
             The :class:`~tslumd.tallyobj.Tally` instance
         """
-        input_ids = self.bound_input_tally_keys.get(tally_key, set())
-        for key in input_ids:
-            inp = self.bound_inputs[key]
+        for inp in self.bound_input_tally_keys.get(tally_key, ()):
             tally = inp.get_tally(tally_key)
             if tally is not None:
                 yield inp, tally
@@ -425,10 +627,15 @@ class BaseOutput(BaseIO, namespace='output'):
         if isinstance(tally, Tally):
             tally_key = tally.id
             result |= tally[tally_type]
+            if result == TallyColor.AMBER:
+                return result
         else:
             tally_key = tally
         for inp, _tally in self.get_all_input_tallies(tally_key):
             color = inp.get_tally_color(tally_key, tally_type)
             if color is not None:
                 result |= color
+                # No further inputs can change the result once all colors are set
+                if result == TallyColor.AMBER:
+                    break
         return result
@@ -1,17 +1,20 @@
 import asyncio
 import click
 
-from tslumd import TallyType
-
 from tallypi.manager import Manager
+from tallypi.main import install_uvloop, enable_eager_tasks
 from tallypi.config import Config
-from tallypi.common import (SingleTallyConfig, MultiTallyConfig)
+from tallypi.common import (
+    SingleTallyConfig, MultiTallyConfig, tally_type_from_name,
+)
 from tallypi.baseio import BaseIO, BaseInput, BaseOutput
 from tallypi import outputs
 
 def build_single_tally_conf(screen_index, tally_index, tally_type):
     if isinstance(tally_type, str):
-        tally_type = getattr(TallyType, tally_type)
+        name, tally_type = tally_type, tally_type_from_name(tally_type)
+        if tally_type is None:
+            raise click.BadParameter(f'Unknown tally type "{name}"', param_hint='tally_type')
     return SingleTallyConfig(
         screen_index=screen_index,
         tally_index=tally_index,
@@ -22,12 +25,16 @@ def add_object_to_config(obj: BaseIO):
     async def do_add():
         mgr = Manager()
         await mgr.read_config()
+        mgr.config_write_evt.clear()
         if isinstance(obj, BaseInput):
             await mgr.add_input(obj)
         elif isinstance(obj, BaseOutput):
             await mgr.add_output(obj)
-        await asyncio.sleep(.1)
-        await mgr.write_config()
+        # The manager writes the config from its update event handler
+        try:
+            await asyncio.wait_for(mgr.config_write_evt.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            await mgr.write_config()
         click.echo(mgr.config.filename.read_text())
     loop = asyncio.get_event_loop()
     loop.run_until_complete(do_add())
@@ -40,9 +47,32 @@ def check_config():
     loop = asyncio.get_event_loop()
     loop.run_until_complete(do_check())
 
+def close_loop(loop: asyncio.AbstractEventLoop):
+    """Let any remaining tasks (such as event callbacks still pending from
+    the :class:`~.manager.Manager`) finish, then close the loop
+    """
+    if loop.is_closed():
+        return
+    tasks = asyncio.all_tasks(loop)
+    if len(tasks):
+        _, pending = loop.run_until_complete(asyncio.wait(tasks, timeout=5))
+        for task in pending:
+            task.cancel()
+        if len(pending):
+            loop.run_until_complete(asyncio.wait(pending))
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+
 @click.group()
-def cli():
-    pass
+@click.pass_context
+def cli(ctx):
+    # A single loop is created here and shared by the subcommands (and by any
+    # objects they create) for the whole invocation
+    install_uvloop()
+    loop = asyncio.new_event_loop()
+    enable_eager_tasks(loop)
+    asyncio.set_event_loop(loop)
+    ctx.call_on_close(lambda: close_loop(loop))
 
 @cli.command('show')
 def show():
@@ -91,7 +121,6 @@ def add_output(ctx, screen_index, tally_index, tally_type):
     ctx.obj['screen_index'] = screen_index
     ctx.obj['tally_index'] = tally_index
     ctx.obj['tally_type'] = tally_type
-    ctx.obj['tally_conf'] = build_single_tally_conf(screen_index, tally_index, tally_type)
 
 @add_output.command('rgbmatrix')
 @click.argument('display_type', type=click.Choice(['indicator', 'matrix']))
@@ -101,8 +130,8 @@ def add_rgbmatrix_output(ctx, display_type, brightness):
     display_type = display_type.title()
     ns = f'output.rgbmatrix5x5.{display_type}'
     cls = BaseIO.get_class_for_namespace(ns)
-    tally_conf = ctx.obj['tally_conf']
-    obj = cls(ctx.obj['tally_conf'], brightness_scale=brightness)
+    tally_conf = build_single_tally_conf(**ctx.obj)
+    obj = cls(tally_conf, brightness_scale=brightness)
     add_object_to_config(obj)
 
 @add_output.command('led')
@@ -118,7 +147,8 @@ def add_led_output(ctx, pin, active_low, pwm, brightness):
         ns = 'output.gpio.LED'
     cls = BaseIO.get_class_for_namespace(ns)
     active_high = not active_low
-    obj = cls(ctx.obj['tally_conf'], pin, active_high=active_high, brightness_scale=brightness)
+    tally_conf = build_single_tally_conf(**ctx.obj)
+    obj = cls(tally_conf, pin, active_high=active_high, brightness_scale=brightness)
     add_object_to_config(obj)
 
 @add_output.command('rgbled')
@@ -130,7 +160,8 @@ def add_rgbled_output(ctx, pins, active_low, brightness):
     ns = 'output.gpio.RGBLED'
     cls = BaseIO.get_class_for_namespace(ns)
     active_high = not active_low
-    obj = cls(ctx.obj['tally_conf'], pins, active_high=active_high, brightness_scale=brightness)
+    tally_conf = build_single_tally_conf(**ctx.obj)
+    obj = cls(tally_conf, pins, active_high=active_high, brightness_scale=brightness)
     add_object_to_config(obj)
 
 if __name__ == '__main__':
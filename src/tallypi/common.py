@@ -1,11 +1,15 @@
 import dataclasses
+import operator
+import sys
+import weakref
 from dataclasses import dataclass, field, InitVar
-from typing import Dict, Tuple, List, Optional, Union
+from typing import Any, Dict, Tuple, List, Optional, Union, ClassVar
 from pydispatch.properties import ObservableList
 
 from tslumd import Screen, Tally, TallyType, TallyKey, TallyColor
 
 from .config import Option, ListOption
+from .utils import add_slots
 
 __all__ = (
     'Pixel', 'Rgb', 'TallyConfig', 'SingleTallyConfig', 'MultiTallyConfig',
@@ -17,13 +21,123 @@ Rgb = Tuple[int, int, int] #: A color tuple of ``(r, g, b)``
 TallyOrTallyConfig = Union[Tally, 'SingleTallyConfig']
 TallyOrMultiTallyConfig = Union[TallyOrTallyConfig, 'MultiTallyConfig']
 
+_object_setattr = object.__setattr__
+
+_TALLY_TYPE_BY_NAME: Dict[str, TallyType] = dict(TallyType.__members__)
+_TALLY_TYPE_NAMES: Tuple[str, ...] = tuple(_TALLY_TYPE_BY_NAME)
+
+# Every combination of the tally type flags and colors mapped to and from
+# their string forms (including combined names such as "rh_tally|txt_tally").
+# The strings are interned so they share the same object (and cached hash)
+# as any keys or literals of the same value
+_TALLY_TYPE_TO_STR: Dict[TallyType, str] = {
+    tt: sys.intern(tt.to_str()) for tt in map(TallyType, range(TallyType.all_tally + 1))
+}
+_TALLY_TYPE_FROM_STR: Dict[str, TallyType] = {s: tt for tt, s in _TALLY_TYPE_TO_STR.items()}
+_TALLY_COLOR_TO_STR: Dict[TallyColor, str] = {
+    c: sys.intern(c.to_str()) for c in map(TallyColor, range(TallyColor.AMBER + 1))
+}
+_TALLY_COLOR_FROM_STR: Dict[str, TallyColor] = {s: c for c, s in _TALLY_COLOR_TO_STR.items()}
+
+def tally_type_from_name(name: str) -> Optional[TallyType]:
+    """Get the :class:`~tslumd.common.TallyType` member with the given name
+    (such as ``"rh_tally"``), or ``None`` if there is no such member
+    """
+    return _TALLY_TYPE_BY_NAME.get(name)
+
+def _tally_type_from_str(s: str) -> TallyType:
+    tt = _TALLY_TYPE_FROM_STR.get(s)
+    if tt is None:
+        tt = TallyType.from_str(s)
+    return tt
+
+def _tally_type_to_str(tally_type: TallyType) -> str:
+    s = _TALLY_TYPE_TO_STR.get(tally_type)
+    if s is None:
+        s = sys.intern(tally_type.to_str())
+    return s
+
+def _tally_color_from_str(s: str) -> TallyColor:
+    c = _TALLY_COLOR_FROM_STR.get(s)
+    if c is None:
+        c = TallyColor.from_str(s)
+    return c
+
+def _tally_color_to_str(color: TallyColor) -> str:
+    s = _TALLY_COLOR_TO_STR.get(color)
+    if s is None:
+        s = sys.intern(color.to_str())
+    return s
+
 TallyColorOption = Option(
     name='color_mask', type=str, required=False, title='Color',
-    serialize_cb=lambda x: x.to_str(),
-    validate_cb=lambda x: TallyColor.from_str(x),
+    serialize_cb=_tally_color_to_str,
+    validate_cb=_tally_color_from_str,
 )
 
+def _normalize_int(ix: int) -> Optional[int]:
+    # Fast path for plain ints (including TallyKey members)
+    return None if ix == 0xffff else ix
+
+def _screen_from_key(key: TallyKey) -> Optional[int]:
+    return normalize_screen(key[0])
+
+# Normalized (screen, tally_index) of Tally objects keyed by id(). The
+# indices of a Tally never change, so entries are only removed when the
+# Tally itself is garbage collected
+_TALLY_NORM_CACHE: Dict[int, Tuple[weakref.ref, Tuple[Optional[int], Optional[int]]]] = {}
+
+def _discard_tally_norm(ref: weakref.ref, key: int):
+    entry = _TALLY_NORM_CACHE.get(key)
+    if entry is not None and entry[0] is ref:
+        del _TALLY_NORM_CACHE[key]
+
+def _normalize_tally(tally: Tally) -> Tuple[Optional[int], Optional[int]]:
+    key = id(tally)
+    entry = _TALLY_NORM_CACHE.get(key)
+    if entry is not None and entry[0]() is tally:
+        return entry[1]
+    screen = tally.screen
+    r = (
+        None if screen.is_broadcast else screen.index,
+        None if tally.is_broadcast else tally.index,
+    )
+    ref = weakref.ref(tally, lambda ref, key=key: _discard_tally_norm(ref, key))
+    _TALLY_NORM_CACHE[key] = (ref, r)
+    return r
+
+def _screen_from_tally(tally: Tally) -> Optional[int]:
+    return _normalize_tally(tally)[0]
+
+def _screen_from_screen(screen: Screen) -> Optional[int]:
+    if screen.is_broadcast:
+        return None
+    return screen.index
+
+def _tally_index_from_key(key: TallyKey) -> Optional[int]:
+    return normalize_tally_index(key[1])
+
+def _tally_index_from_tally(tally: Tally) -> Optional[int]:
+    return _normalize_tally(tally)[1]
+
+# Handlers for the exact argument types seen on the matching paths.
+# Anything else (configs, None, subclasses) uses the isinstance checks
+_SCREEN_HANDLERS = {
+    int: _normalize_int,
+    tuple: _screen_from_key,
+    Tally: _screen_from_tally,
+    Screen: _screen_from_screen,
+}
+_TALLY_INDEX_HANDLERS = {
+    int: _normalize_int,
+    tuple: _tally_index_from_key,
+    Tally: _tally_index_from_tally,
+}
+
 def normalize_screen(obj: Union[TallyKey, TallyOrMultiTallyConfig, int]) -> Union[None, int]:
+    handler = _SCREEN_HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
     if obj is None:
         return None
     elif isinstance(obj, tuple):
@@ -47,6 +161,9 @@ def normalize_screen(obj: Union[TallyKey, TallyOrMultiTallyConfig, int]) -> Unio
     return screen
 
 def normalize_tally_index(obj: Union[TallyKey, TallyOrTallyConfig, int]) -> Union[None, int]:
+    handler = _TALLY_INDEX_HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
     if isinstance(obj, tuple):
         obj = obj[1]
     if isinstance(obj, int):
@@ -68,15 +185,35 @@ def get_tally_key(obj: Union[TallyKey, TallyOrTallyConfig]) -> TallyKey:
         return obj
     return obj.id
 
+@add_slots()
 @dataclass
 class TallyConfig:
     """Configuration data for tally assignment
     """
 
+    @classmethod
+    def _get_field_names(cls) -> Tuple[str, ...]:
+        names = cls.__dict__.get('_field_names')
+        if names is None:
+            names = tuple(f.name for f in dataclasses.fields(cls))
+            cls._field_names = names
+        return names
+
+    @classmethod
+    def _get_field_defaults(cls) -> Dict[str, Any]:
+        defaults = cls.__dict__.get('_field_defaults')
+        if defaults is None:
+            defaults = {
+                f.name:f.default for f in dataclasses.fields(cls)
+                if f.default is not dataclasses.MISSING
+            }
+            cls._field_defaults = defaults
+        return defaults
+
     def to_dict(self) -> Dict:
         """Serialize the config data
         """
-        return dataclasses.asdict(self)
+        return {name:getattr(self, name) for name in self._get_field_names()}
 
     @classmethod
     def from_dict(cls, d: Dict) -> 'TallyConfig':
@@ -85,6 +222,10 @@ class TallyConfig:
         return cls(**d)
 
 
+@add_slots(
+    '_norm_screen', '_norm_tally', '_tally_key', '_tally_type_value',
+    '_dict_cache',
+)
 @dataclass
 class SingleTallyConfig(TallyConfig):
     """Configuration for a single tally
@@ -120,14 +261,88 @@ class SingleTallyConfig(TallyConfig):
     """User-defined name for the tally
     """
 
+    _match_edit_count: ClassVar[int] = 0
+
+    def __init__(
+        self,
+        tally_index: int,
+        tally_type: TallyType = ...,
+        color_mask: TallyColor = ...,
+        screen_index: Optional[int] = ...,
+        name: Optional[str] = ...,
+    ):
+        # Replaces the generated method so the fields are set directly rather
+        # than through __setattr__. The defaults are set from the field
+        # declarations after the class is created
+        _object_setattr(self, 'tally_index', tally_index)
+        _object_setattr(self, 'tally_type', tally_type)
+        _object_setattr(self, 'color_mask', color_mask)
+        _object_setattr(self, 'screen_index', screen_index)
+        _object_setattr(self, 'name', name)
+        self.__post_init__()
+
+    def __post_init__(self):
+        self._update_derived()
+        _object_setattr(self, '_dict_cache', None)
+
+    def __getstate__(self):
+        return {name:getattr(self, name) for name in self._get_field_names()}
+
+    def __setstate__(self, state):
+        # Used by copy and pickle. Set the fields directly since __setattr__
+        # expects the derived attributes to exist
+        for name, value in state.items():
+            _object_setattr(self, name, value)
+        self.__post_init__()
+
+    def __setattr__(self, name, value):
+        _object_setattr(self, name, value)
+        if name in _SINGLE_TALLY_FIELD_SET:
+            _object_setattr(self, '_dict_cache', None)
+            if name == 'screen_index' or name == 'tally_index' or name == 'tally_type':
+                self._update_derived()
+                # Lets any MultiTallyConfig containing this instance know
+                # that its lookups may be out of date
+                SingleTallyConfig._match_edit_count += 1
+
+    def _update_derived(self):
+        # Keep the normalized indices used for matching, the tally_key and
+        # the int value of tally_type (bitwise operators on the flag itself
+        # are comparatively slow) in sync with the fields
+        scr, tly = self.screen_index, self.tally_index
+        if scr == 0xffff:
+            scr = None
+        if tly == 0xffff:
+            tly = None
+        _object_setattr(self, '_norm_screen', scr)
+        _object_setattr(self, '_norm_tally', tly)
+        _object_setattr(self, '_tally_key', (
+            0xffff if scr is None else scr, 0xffff if tly is None else tly,
+        ))
+        _object_setattr(self, '_tally_type_value', int(self.tally_type))
+
+    def __eq__(self, other):
+        # Replaces the generated method to avoid building tuples of all fields
+        # and to stop at the first differing field (usually tally_index)
+        if other is self:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.tally_index == other.tally_index and
+            self.screen_index == other.screen_index and
+            self.tally_type == other.tally_type and
+            self.color_mask == other.color_mask and
+            self.name == other.name
+        )
+
     @classmethod
     def from_tally(cls, tally: Tally, **kwargs) -> 'SingleTallyConfig':
         """Create a :class:`SingleTallyConfig` from a :class:`~tslumd.tallyobj.Tally`
         """
         kwargs.setdefault('tally_type', TallyType.all_tally)
-        scr, tly = tally.id
-        scr = normalize_screen(tally)
-        tly = normalize_tally_index(tally)
+        scr = _screen_from_tally(tally)
+        tly = _tally_index_from_tally(tally)
         return cls(screen_index=scr, tally_index=tly, **kwargs)
 
     @property
@@ -138,12 +353,7 @@ class SingleTallyConfig(TallyConfig):
         If :attr:`screen_index` or :attr:`tally_index` is ``None``, they are set
         to 65535 (``0xffff``)
         """
-        scr, tly = self.screen_index, self.tally_index
-        if scr is None:
-            scr = 0xffff
-        if tly is None:
-            tly = 0xffff
-        return (scr, tly)
+        return self._tally_key
 
     @property
     def id(self) -> TallyKey:
@@ -157,24 +367,23 @@ class SingleTallyConfig(TallyConfig):
         """``True`` if :attr:`screen_index` is set to ``None`` or the "broadcast"
         address of 65535 (``0xffff``)
         """
-        return self.screen_index in (None, 0xffff)
+        return self._norm_screen is None
 
     @property
     def is_broadcast_tally(self) -> bool:
         """``True`` if :attr:`tally_index` is set to ``None`` or the "broadcast"
         address of 65535 (``0xffff``)
         """
-        return self.tally_index in (None, 0xffff)
+        return self._norm_tally is None
 
     @classmethod
     def get_init_options(cls) -> Tuple[Option]:
-        tt_choices = tuple((tt.name for tt in TallyType))
         return (
             Option(name='tally_index', type=int, required=True, title='Index'),
             Option(
-                name='tally_type', type=str, required=True, choices=tt_choices,
-                serialize_cb=lambda x: x.to_str(),
-                validate_cb=lambda x: TallyType.from_str(x),
+                name='tally_type', type=str, required=True, choices=_TALLY_TYPE_NAMES,
+                serialize_cb=_tally_type_to_str,
+                validate_cb=_tally_type_from_str,
                 title='TallyType',
             ),
             TallyColorOption,
@@ -202,15 +411,31 @@ class SingleTallyConfig(TallyConfig):
                 was found.
 
         """
+        # SingleTallyConfig is not subclassed so exact type checks are used
+        oth_type = type(other)
+        self_tt = self._tally_type_value
+        if oth_type is SingleTallyConfig:
+            # Both sides have their normalized values cached so compare
+            # them directly without going through matches_screen
+            if not self_tt & other._tally_type_value or not self_tt & int(tally_type):
+                return False
+            self_scr, oth_scr = self._norm_screen, other._norm_screen
+            if self_scr is not None and oth_scr is not None and self_scr != oth_scr:
+                return False
+            self_ix, oth_ix = self._norm_tally, other._norm_tally
+            if self_ix is not None and oth_ix is not None and self_ix != oth_ix:
+                return False
+            return self if return_matched else True
+
         if not self.matches_screen(other):
             return False
-        if isinstance(other, SingleTallyConfig):
-            if self.tally_type & other.tally_type == TallyType.no_tally:
-                return False
-        if self.tally_type & tally_type == TallyType.no_tally:
+        if not self_tt & int(tally_type):
             return False
-        self_ix = normalize_tally_index(self)
-        oth_ix = normalize_tally_index(other)
+        self_ix = self._norm_tally
+        if oth_type is tuple:
+            oth_ix = _normalize_int(other[1])
+        else:
+            oth_ix = normalize_tally_index(other)
         if None in (self_ix, oth_ix):
             r = True
         else:
@@ -231,25 +456,64 @@ class SingleTallyConfig(TallyConfig):
             other: A :class:`SingleTallyConfig`, :class:`MultiTallyConfig`,
                 :class:`tslumd.tallyobj.Tally` or :class:`int`
         """
-        if self.is_broadcast_screen:
+        self_screen = self._norm_screen
+        if self_screen is None:
             return True
-        self_screen = normalize_screen(self)
-        oth_screen = normalize_screen(other)
-        if None not in (self_screen, oth_screen):
+        oth_type = type(other)
+        if oth_type is int:
+            oth_screen = _normalize_int(other)
+        elif oth_type is tuple:
+            oth_screen = _normalize_int(other[0])
+        elif oth_type is SingleTallyConfig:
+            oth_screen = other._norm_screen
+        else:
+            oth_screen = normalize_screen(other)
+        if oth_screen is not None:
             return self_screen == oth_screen
         return True
 
     def to_dict(self) -> Dict:
-        d = super().to_dict()
-        d['tally_type'] = d['tally_type'].to_str()
-        return d
+        """Serialize the config data
+
+        The result is cached until any of the fields are changed and a copy
+        of it is returned
+        """
+        d = self._dict_cache
+        if d is None:
+            d = {
+                'tally_index':self.tally_index,
+                'tally_type':_tally_type_to_str(self.tally_type),
+                'color_mask':self.color_mask,
+                'screen_index':self.screen_index,
+                'name':self.name,
+            }
+            _object_setattr(self, '_dict_cache', d)
+        return d.copy()
 
     @classmethod
     def from_dict(cls, d: Dict) -> 'SingleTallyConfig':
-        kw = d.copy()
-        if not isinstance(kw['tally_type'], TallyType):
-            kw['tally_type'] = TallyType.from_str(kw['tally_type'])
-        return super().from_dict(kw)
+        defaults = _SINGLE_TALLY_DEFAULTS
+        tally_type = d.get('tally_type', defaults['tally_type'])
+        if type(tally_type) is not TallyType:
+            tally_type = _tally_type_from_str(tally_type)
+        keys = d.keys()
+        if keys == _SINGLE_TALLY_FIELD_SET:
+            # All fields are present (as produced by to_dict) so they can be
+            # passed positionally
+            return cls(
+                d['tally_index'], tally_type, d['color_mask'],
+                d['screen_index'], d['name'],
+            )
+        if keys <= _SINGLE_TALLY_FIELD_SET:
+            # Fill in defaults for missing fields rather than copying the dict
+            return cls(
+                d['tally_index'], tally_type,
+                d.get('color_mask', defaults['color_mask']),
+                d.get('screen_index', defaults['screen_index']),
+                d.get('name', defaults['name']),
+            )
+        # Unknown keys; let the constructor raise
+        return cls(**d)
 
     def create_screen(self) -> Screen:
         """Create a :class:`tslumd.tallyobj.Screen` with the :attr:`screen_index`
@@ -282,7 +546,54 @@ class SingleTallyConfig(TallyConfig):
             tally = screen.add_tally(self.tally_index)
         return screen, tally
 
+_SINGLE_TALLY_FIELD_SET = frozenset(SingleTallyConfig._get_field_names())
+_SINGLE_TALLY_DEFAULTS = SingleTallyConfig._get_field_defaults()
+SingleTallyConfig.__init__.__defaults__ = tuple(_SINGLE_TALLY_DEFAULTS.values())
 
+# The normalized values are kept up to date on SingleTallyConfig itself
+_SCREEN_HANDLERS[SingleTallyConfig] = operator.attrgetter('_norm_screen')
+_TALLY_INDEX_HANDLERS[SingleTallyConfig] = operator.attrgetter('_norm_tally')
+
+
+class _TallyList(ObservableList):
+    """An :class:`~pydispatch.properties.ObservableList` that also reports
+    the methods it does not track itself
+
+    These pass an ``op`` keyword argument so that :meth:`MultiTallyConfig._on_change`
+    can tell them apart from appends and removals
+    """
+    def insert(self, index, item):
+        old = self._get_copy_or_none()
+        super().insert(index, self._build_observable(item))
+        self._emit_change(old=old, op='insert')
+
+    def pop(self, *args):
+        old = self._get_copy_or_none()
+        item = super().pop(*args)
+        self._emit_change(old=old, op='pop')
+        return item
+
+    def sort(self, *args, **kwargs):
+        old = self._get_copy_or_none()
+        super().sort(*args, **kwargs)
+        self._emit_change(old=old, op='sort')
+
+    def reverse(self):
+        old = self._get_copy_or_none()
+        super().reverse()
+        self._emit_change(old=old, op='reverse')
+
+    def __imul__(self, n):
+        old = self._get_copy_or_none()
+        result = super().__imul__(n)
+        self._emit_change(old=old, op='__imul__')
+        return result
+
+
+@add_slots(
+    'tallies', 'copy_on_change', '_tallies_by_key', '_memoized_tally_confs',
+    '_memoized_misses', '_tally_count', '_match_edit_count',
+)
 @dataclass
 class MultiTallyConfig(TallyConfig):
     """Configuration for multiple tallies
@@ -318,18 +629,105 @@ class MultiTallyConfig(TallyConfig):
     def __post_init__(self, tallies):
         if tallies is None:
             tallies = []
-        self._tallies_by_key = None
         self.copy_on_change = False
-        self.tallies = ObservableList(tallies, obj=self, property=self)
+        self.tallies = tallies
+
+    def __getstate__(self):
+        state = {name:getattr(self, name) for name in self._get_field_names()}
+        state['tallies'] = list(self.tallies)
+        return state
+
+    def __setstate__(self, state):
+        # Used by copy and pickle. Set the fields directly since __setattr__
+        # expects the lookups to exist
+        state = state.copy()
+        tallies = state.pop('tallies')
+        for name, value in state.items():
+            _object_setattr(self, name, value)
+        self.__post_init__(tallies)
+
+    _MAX_MEMOIZED_MISSES: ClassVar[int] = 4096
+
+    def __setattr__(self, name, value):
+        if name == 'tallies':
+            value = _TallyList(value, obj=self, property=self)
+            _object_setattr(self, '_tally_count', len(value))
+        _object_setattr(self, name, value)
+        if name in _MULTI_TALLY_FIELD_SET:
+            self._reset_lookups()
+
+    def _reset_lookups(self):
+        # New objects are assigned (rather than cleared) since this is also
+        # called from __init__ before they exist
+        _object_setattr(self, '_memoized_tally_confs', None)
+        _object_setattr(self, '_tallies_by_key', None)
+        _object_setattr(self, '_memoized_misses', set())
+        _object_setattr(self, '_match_edit_count', SingleTallyConfig._match_edit_count)
+
+    def _check_tally_edits(self):
+        # The configs in tallies may have been edited in place since the
+        # lookups were built (see SingleTallyConfig._match_edit_count)
+        if SingleTallyConfig._match_edit_count != self._match_edit_count:
+            self._reset_lookups()
 
     def _on_change(self, obj, old, value, **kwargs):
         """This is a callback from :class:`pydispatch.properties.ObservableList`
+
+        Only append(), extend() and removals are reported without any keyword
+        arguments and update the cached lookups in place. Anything else
+        (including item assignment) clears them
+        """
+        if value is not self.tallies:
+            # A list that has since been replaced
+            return
+        prev_count = self._tally_count
+        count = self._tally_count = len(value)
+        if kwargs or count == prev_count:
+            self._reset_lookups()
+        elif count > prev_count:
+            # append() and extend() only add to the end, so existing positions
+            # and matches are unchanged. Previous misses may now match though
+            index = self._tallies_by_key
+            if index is not None:
+                for i in range(prev_count, count):
+                    t = value[i]
+                    index.setdefault((t._norm_screen, t._norm_tally), []).append((i, t))
+            self._memoized_misses.clear()
+        else:
+            # remove(), del or clear(). Positions have shifted, but the
+            # remaining matches (and misses) are still valid. Only forget the
+            # matches that were removed
+            self._tallies_by_key = None
+            memo = self._memoized_tally_confs
+            if memo:
+                present = set(map(id, value))
+                for t_id, by_type in list(memo.items()):
+                    for ttype, t in list(by_type.items()):
+                        if id(t) not in present:
+                            del by_type[ttype]
+                    if not by_type:
+                        del memo[t_id]
+
+    @property
+    def tallies_by_key(self) -> Dict[Tuple[Optional[int], Optional[int]], List[Tuple[int, SingleTallyConfig]]]:
+        """Index of :attr:`tallies` grouped by their normalized
+        (``screen_index``, ``tally_index``), with ``None`` for broadcast values
+
+        Each value is a list of ``(position, config)`` in the order they
+        appear in :attr:`tallies`
         """
-        self._memoized_tally_confs = None
+        self._check_tally_edits()
+        r = self._tallies_by_key
+        if r is None:
+            r = self._tallies_by_key = {}
+            for i, t in enumerate(self.tallies):
+                key = (t._norm_screen, t._norm_tally)
+                r.setdefault(key, []).append((i, t))
+        return r
 
     @property
     def memoized_tally_confs(self) -> Dict[TallyKey, Dict[TallyType, SingleTallyConfig]]:
-        r = getattr(self, '_memoized_tally_confs', None)
+        r = self._memoized_tally_confs
         if r is None:
             r = self._memoized_tally_confs = {}
         return r
@@ -414,7 +812,10 @@ class MultiTallyConfig(TallyConfig):
             tally: Either a :class:`SingleTallyConfig` or a
                 :class:`tslumd.tallyobj.Tally` instance
         """
+        if not self.allow_all and not len(self.tallies):
+            return False
 
+        self._check_tally_edits()
         memoized = self.search_memoized(tally, tally_type)
         if memoized is not None:
             if return_matched:
@@ -429,12 +830,25 @@ class MultiTallyConfig(TallyConfig):
                 self.add_memoized(ret)
                 return ret
             return True
+        # Misses are remembered too (the result for a SingleTallyConfig also
+        # depends on its own tally_type). They are forgotten whenever tallies
+        # or any of the configs in it change
+        if type(tally) is SingleTallyConfig:
+            miss_key = (tally.tally_key, tally_type, tally.tally_type)
+        else:
+            miss_key = (get_tally_key(tally), tally_type, None)
+        misses = self._memoized_misses
+        if miss_key in misses:
+            return False
         t = self._search_tallies(tally, tally_type)
         if t is not None:
             self.add_memoized(t)
             if return_matched:
                 return t
             return True
+        if len(misses) >= self._MAX_MEMOIZED_MISSES:
+            misses.clear()
+        misses.add(miss_key)
         return False
 
     def _search_tallies(
@@ -442,9 +856,29 @@ class MultiTallyConfig(TallyConfig):
         tally: Union[TallyOrTallyConfig, TallyKey],
         tally_type: Optional[TallyType] = TallyType.all_tally
     ) -> Optional[SingleTallyConfig]:
-        for t in self.tallies:
-            if t.matches(tally, tally_type):
-                return t
+        if type(tally) is SingleTallyConfig:
+            scr, tly = tally._norm_screen, tally._norm_tally
+        else:
+            scr, tly = normalize_screen(tally), normalize_tally_index(tally)
+        if scr is None or tly is None:
+            # Broadcast queries can match any entry
+            for t in self.tallies:
+                if t.matches(tally, tally_type):
+                    return t
+            return None
+
+        # Only configs with an equal or broadcast index can match. Search the
+        # candidate groups and keep the first match by position in tallies
+        index = self.tallies_by_key
+        result, result_pos = None, None
+        for key in ((scr, tly), (None, tly), (scr, None), (None, None)):
+            for i, t in index.get(key, ()):
+                if result_pos is not None and i > result_pos:
+                    break
+                if t.matches(tally, tally_type):
+                    result, result_pos = t, i
+                    break
+        return result
 
     def search_memoized(
         self,
@@ -473,14 +907,20 @@ class MultiTallyConfig(TallyConfig):
 
     def to_dict(self) -> Dict:
         tallies = [c.to_dict() for c in self.tallies]
-        return {'tallies':tallies, 'allow_all':self.allow_all}
+        return {
+            'tallies':tallies, 'screen_index':self.screen_index,
+            'allow_all':self.allow_all, 'name':self.name,
+        }
 
     @classmethod
     def from_dict(cls, d: Dict) -> 'MultiTallyConfig':
+        from_dict = SingleTallyConfig.from_dict
+        tallies = [from_dict(td) for td in d['tallies']]
+        if d.keys() == _MULTI_TALLY_FIELD_SET:
+            return cls(tallies, d['screen_index'], d['allow_all'], d['name'])
         kw = d.copy()
-        tallies = kw['tallies']
-        kw['tallies'] = [SingleTallyConfig.from_dict(td) for td in tallies]
-        return super().from_dict(kw)
+        kw['tallies'] = tallies
+        return cls(**kw)
 
     def _create_single_conf(
         self,
@@ -501,6 +941,9 @@ class MultiTallyConfig(TallyConfig):
             ret = SingleTallyConfig.from_tally(tally, tally_type=tally_type)
         return ret
 
+# The keys used by to_dict (tallies is an InitVar rather than a field)
+_MULTI_TALLY_FIELD_SET = frozenset(('tallies',) + MultiTallyConfig._get_field_names())
+
 SingleTallyOption = Option(
     name='config', type=SingleTallyConfig, required=True,
     sub_options=SingleTallyConfig.get_init_options(),
@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 
 from ruamel.yaml import YAML
 
+from .utils import add_slots
+
 
 _GET_INIT_OPTS = 'get_init_options'
 
@@ -31,6 +33,7 @@ class InvalidLengthError(OptionError):
     def __str__(self):
         return f'Length must be between {self.opt.min_length} and {self.opt.max_length}, got {self.opt_value}'
 
+@add_slots('_choice_set', '_validate_impl', '_serialize_impl')
 @dataclass
 class Option:
     """A configuration option definition
@@ -65,6 +68,23 @@ class Option:
     def __post_init__(self):
         if self.title is None:
             self.title = self.name
+        # Choose the validate/serialize implementations once, since Option
+        # definitions do not change after creation
+        self._choice_set = frozenset(self.choices)
+        if self.validate_cb is not None:
+            self._validate_impl = self.validate_cb
+        elif len(self.sub_options):
+            self._validate_impl = self._validate_sub_options
+        elif len(self.choices):
+            self._validate_impl = self._validate_choice
+        else:
+            self._validate_impl = self._validate_value
+        if self.serialize_cb is not None:
+            self._serialize_impl = self.serialize_cb
+        elif len(self.sub_options):
+            self._serialize_impl = self._serialize_sub_options
+        else:
+            self._serialize_impl = self._serialize_value
 
     def validate(self, value: Any) -> Any:
         """Validate and transform the given value to the defined :attr:`type`
@@ -78,30 +98,46 @@ class Option:
             If :attr:`validate_cb` is defined, no :attr:`sub_options` will be
             processed.
         """
-        if self.validate_cb is not None:
-            return self.validate_cb(value)
+        return self._validate_impl(value)
+
+    def _validate_none(self) -> None:
+        if self.required:
+            raise RequiredError(self)
+        return None
 
+    def _validate_sub_options(self, value: Any) -> Any:
         if value is None:
-            if self.required:
-                raise RequiredError(self)
-            return None
-
-        if len(self.sub_options):
-            assert isinstance(value, dict)
-            sub_values = {}
-            for opt in self.sub_options:
-                if opt.name not in value:
-                    if opt.required:
-                        raise RequiredError(opt)
-                    continue
-                sub_values[opt.name] = opt.validate(value[opt.name])
-            return self.type(**sub_values)
-        if len(self.choices) and value not in self.choices:
+            return self._validate_none()
+        assert isinstance(value, dict)
+        sub_values = {}
+        for opt in self.sub_options:
+            if opt.name not in value:
+                if opt.required:
+                    raise RequiredError(opt)
+                continue
+            sub_values[opt.name] = opt.validate(value[opt.name])
+        return self.type(**sub_values)
+
+    def _validate_choice(self, value: Any) -> Any:
+        if value is None:
+            return self._validate_none()
+        try:
+            valid = value in self._choice_set
+        except TypeError:
+            valid = False
+        if not valid:
             raise ChoiceError(self, value)
         if not isinstance(value, self.type):
             raise InvalidTypeError(self, value)
         return value
 
+    def _validate_value(self, value: Any) -> Any:
+        if value is None:
+            return self._validate_none()
+        if not isinstance(value, self.type):
+            raise InvalidTypeError(self, value)
+        return value
+
     def serialize(self, value: Any) -> Any:
         """Serialize the given value of type :attr:`type`
 
@@ -113,16 +149,19 @@ class Option:
             If :attr:`serialize_cb` is defined, no :attr:`sub_options` will be
             processed.
         """
-        if self.serialize_cb is not None:
-            return self.serialize_cb(value)
-        if len(self.sub_options):
-            result = {}
-            for opt in self.sub_options:
-                sub_value = getattr(value, opt.name)
-                result[opt.name] = opt.serialize(sub_value)
-            return result
+        return self._serialize_impl(value)
+
+    def _serialize_sub_options(self, value: Any) -> Dict:
+        result = {}
+        for opt in self.sub_options:
+            sub_value = getattr(value, opt.name)
+            result[opt.name] = opt.serialize(sub_value)
+        return result
+
+    def _serialize_value(self, value: Any) -> Any:
         return value
 
+@add_slots()
 @dataclass
 class ListOption(Option):
     """Option definition for lists
@@ -145,7 +184,9 @@ class ListOption(Option):
             if self.required:
                 raise RequiredError(self)
             return []
-        if not isinstance(value, Sequence):
+        # Values loaded from config files are always lists
+        value_type = type(value)
+        if value_type is not list and value_type is not tuple and not isinstance(value, Sequence):
             raise InvalidTypeError(self, value)
 
         if self.min_length is not None and len(value) < self.min_length:
@@ -153,10 +194,8 @@ class ListOption(Option):
         if self.max_length is not None and len(value) > self.max_length:
             raise InvalidLengthError(self, value)
 
-        result = []
-        for item in value:
-            result.append(super().validate(item))
-        return result
+        validate = self._validate_impl
+        return [validate(item) for item in value]
 
     def serialize(self, value: Sequence) -> List:
         """Serialize the given list of items
@@ -164,10 +203,8 @@ class ListOption(Option):
         The base class :meth:`Option.serialize` is called for each element of
         the input.
         """
-        result = []
-        for item in value:
-            result.append(super().serialize(item))
-        return result
+        serialize = self._serialize_impl
+        return [serialize(item) for item in value]
 
 class Config:
     """Config data storage using YAML
@@ -184,6 +221,8 @@ class Config:
         if not isinstance(filename, Path):
             filename = Path(filename)
         self.filename = filename
+        self._yaml_loader = None
+        self._yaml_dumper = None
 
     def read(self) -> Dict:
         """Read data from :attr:`filename` and return the result
@@ -192,14 +231,18 @@ class Config:
         """
         if not self.filename.exists():
             return {}
-        yaml = YAML(typ='safe')
-        data = yaml.load(self.filename)
+        yaml = self._yaml_loader
+        if yaml is None:
+            yaml = self._yaml_loader = YAML(typ='safe')
+        data = yaml.load(self.filename.read_bytes())
         return data
 
     def write(self, data: Dict):
         """Write the given :class:`dict` data to the config :attr:`filename`
         """
-        yaml = YAML()
+        yaml = self._yaml_dumper
+        if yaml is None:
+            yaml = self._yaml_dumper = YAML()
         if not self.filename.parent.exists():
             self.filename.parent.mkdir(parents=True)
         yaml.dump(data, self.filename)
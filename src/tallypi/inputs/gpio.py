@@ -42,6 +42,11 @@ class GpioInput(BaseInput, namespace='gpio.GpioInput', final=True):
         if self.running:
             return
         self.running = True
+        # The tally attribute and colors used by the update handlers are
+        # stored here along with the tally itself
+        self._tally_attr = self.config.tally_type.name
+        self._props_changed = (self._tally_attr,)
+        self._color_on = self.config.color_mask
         self.screen, self.tally = self.config.create_tally()
         self.tally.bind(on_update=self._on_tallyobj_update)
         self.emit('on_screen_added', self, self.screen)
@@ -74,21 +79,22 @@ class GpioInput(BaseInput, namespace='gpio.GpioInput', final=True):
 
     def get_all_tallies(self, screen_index: Optional[int] = None) -> Iterable[Tally]:
         if self.screen is None:
-            yield None
-        elif screen_index is not None and not self.matches_screen(screen_index):
-            yield None
-        else:
-            yield self.tally
+            return
+        elif screen_index is not None and not self.screen_matches(screen_index):
+            return
+        yield self.tally
 
     def _set_tally_state(self, state: bool):
-        attr = self.config.tally_type.name
-        color = {True: self.config.color_mask, False: TallyColor.OFF}[state]
+        color = self._color_on if state else TallyColor.OFF
+        attr = self._tally_attr
+        if getattr(self.tally, attr) == color:
+            return
         setattr(self.tally, attr, color)
 
     def _on_tallyobj_update(self, tally: Tally, props_changed: Iterable[str], **kwargs):
-        if self.config.tally_type.name not in props_changed:
+        if self._tally_attr not in props_changed:
             return
-        self.emit('on_tally_updated', self, tally, [self.config.tally_type.name])
+        self.emit('on_tally_updated', self, tally, self._props_changed)
 
     def _on_button_pressed(self, button):
         if button is not self.button:
@@ -98,4 +104,4 @@ class GpioInput(BaseInput, namespace='gpio.GpioInput', final=True):
     def _on_button_released(self, button):
         if button is not self.button:
             return
-        self._set_tally_state(True)
+        self._set_tally_state(False)
@@ -1,6 +1,5 @@
 from loguru import logger
 logger.disable('tslumd.tallyobj')
-import asyncio
 from typing import Optional, Tuple, Iterable, Set
 
 from tslumd import UmdReceiver, TallyType, Screen, Tally, TallyKey
@@ -32,7 +31,6 @@ class UmdInput(BaseInput, namespace='umd.UmdInput', final=True):
                  hostport: int = UmdReceiver.DEFAULT_PORT):
 
         super().__init__(config)
-        self.loop = asyncio.get_event_loop()
         self._screen_indices = set()
         self._tally_keys = set()
         self.receiver = UmdReceiver(hostaddr=hostaddr, hostport=hostport)
@@ -121,13 +119,18 @@ class UmdInput(BaseInput, namespace='umd.UmdInput', final=True):
             self._screen_indices.add(screen.index)
             self.emit('on_screen_added', self, screen)
 
-    @logger.catch
     def _on_receiver_tally_added(self, tally, **kwargs):
-        if self.tally_matches(tally):
-            self._tally_keys.add(tally.id)
-            self.emit('on_tally_added', self, tally)
+        try:
+            if self.tally_matches(tally):
+                self._tally_keys.add(tally.id)
+                self.emit('on_tally_added', self, tally)
+        except Exception:
+            logger.exception('Error handling added tally {}', tally.id)
 
-    @logger.catch
     def _on_receiver_tally_updated(self, tally: Tally, props_changed: Set[str], **kwargs):
-        if tally.id in self._tally_keys:
+        if tally.id not in self._tally_keys:
+            return
+        try:
             self.emit('on_tally_updated', self, tally, props_changed)
+        except Exception:
+            logger.exception('Error handling tally update {}', tally.id)
@@ -4,13 +4,34 @@ import asyncio
 
 from tallypi.manager import Manager
 
+try:
+    import uvloop
+except ImportError: # pragma: no cover
+    uvloop = None
+
+def install_uvloop():
+    """Use :mod:`uvloop` for new event loops if it is installed
+    """
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+def enable_eager_tasks(loop: asyncio.AbstractEventLoop):
+    """Use :func:`asyncio.eager_task_factory` for the given loop if it is
+    available (Python 3.12 and above)
+    """
+    factory = getattr(asyncio, 'eager_task_factory', None)
+    if factory is not None:
+        loop.set_task_factory(factory)
+
 def main():
     async def shutdown(sig, loop, mgr):
         logger.debug(f'Received {sig.name} signal, shutting down..')
         await mgr.close()
         loop.stop()
 
+    install_uvloop()
     loop = asyncio.get_event_loop()
+    enable_eager_tasks(loop)
     mgr = Manager()
     loop.run_until_complete(mgr.open())
     signals = (signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
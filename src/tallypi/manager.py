@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Dict, Iterable, Optional, Any
 
 from pydispatch import Dispatcher
+from tslumd import Tally
 
 from tallypi.baseio import BaseIO, BaseInput, BaseOutput
 from tallypi.config import Config
@@ -44,9 +45,9 @@ class IOContainer(Dispatcher):
             return
         logger.info(f'{self.__class__} starting...')
         self.running = True
-        coros = set()
+        coros = []
         for obj in self.values():
-            coros.add(obj.open())
+            coros.append(obj.open())
         if len(coros):
             await asyncio.gather(*coros)
         logger.info(f'{self.__class__} running')
@@ -58,9 +59,9 @@ class IOContainer(Dispatcher):
             return
         logger.info(f'{self.__class__} stopping...')
         self.running = False
-        coros = set()
+        coros = []
         for obj in self.values():
-            coros.add(obj.close())
+            coros.append(obj.close())
         if len(coros):
             await asyncio.gather(*coros)
         logger.info(f'{self.__class__} stopped...')
@@ -117,13 +118,13 @@ class IOContainer(Dispatcher):
         """Deserialize instances from config data using
         :meth:`.baseio.BaseIO.deserialize`
         """
-        coros = set()
+        coros = []
         for key, val in data.items():
             obj = BaseIO.deserialize(val)
             obj.id = key
             self.objects[key] = obj
             if self.running:
-                coros.add(obj.open())
+                coros.append(obj.open())
             self.emit('object_added', key, obj)
         if len(coros):
             await asyncio.gather(*coros)
@@ -208,8 +209,13 @@ class Outputs(IOContainer):
     """
     objects: Dict[str, BaseOutput]
 
-    async def bind_to_input(self, inp: BaseInput, outp: BaseOutput):
-        await outp.bind_to_input(inp)
+    async def bind_to_input(
+        self,
+        inp: BaseInput,
+        outp: BaseOutput,
+        tallies: Optional[Iterable[Tally]] = None
+    ):
+        await outp.bind_to_input(inp, tallies)
 
     async def bind_all_to_input(self, inp: BaseInput):
         """Attach all :class:`outputs <.baseio.BaseOutput>` to the given
@@ -217,9 +223,11 @@ class Outputs(IOContainer):
 
         Calls :meth:`.baseio.BaseOutput.bind_to_input` for each output instance
         """
-        coros = set()
+        # Collect the input's tallies once and share them between outputs
+        tallies = list(inp.get_all_tallies())
+        coros = []
         for outp in self.values():
-            coros.add(self.bind_to_input(inp=inp, outp=outp))
+            coros.append(self.bind_to_input(inp=inp, outp=outp, tallies=tallies))
         if len(coros):
             await asyncio.gather(*coros)
 
@@ -232,9 +240,9 @@ class Outputs(IOContainer):
 
         Calls :meth:`.baseio.BaseOutput.unbind_from_input` for each output instance
         """
-        coros = set()
+        coros = []
         for outp in self.values():
-            coros.add(self.unbind_from_input(inp=inp, outp=outp))
+            coros.append(self.unbind_from_input(inp=inp, outp=outp))
         if len(coros):
             await asyncio.gather(*coros)
 
@@ -361,9 +369,9 @@ class Manager:
 
     @logger.catch
     async def on_output_added(self, key: str, obj: BaseOutput, **kwargs):
-        coros = set()
+        coros = []
         for inp in self.inputs.values():
-            coros.add(obj.bind_to_input(inp))
+            coros.append(obj.bind_to_input(inp))
         if len(coros):
             await asyncio.gather(*coros)
 
@@ -384,7 +392,9 @@ class Manager:
                 'inputs':self.inputs.serialize(),
                 'outputs':self.outputs.serialize(),
             }
-            self.config.write(data)
+            # File I/O is done in the default executor to avoid blocking the loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.config.write, data)
             self.config_write_evt.set()
 
     async def __aenter__(self):
@@ -16,6 +16,7 @@ from tslumd import TallyType, TallyColor, Tally, TallyKey
 
 from tallypi.common import (
     SingleTallyOption, SingleTallyConfig, MultiTallyConfig, Pixel, Rgb,
+    tally_type_from_name,
 )
 from tallypi.baseio import BaseOutput
 from tallypi.config import Option
@@ -216,9 +217,9 @@ class Matrix(Base, namespace='Matrix', final=True):
     async def on_receiver_tally_change(self, tally: Tally, props_changed: Set[str], **kwargs):
         changed = set()
         for prop in props_changed:
-            if prop not in TallyType.__members__:
+            ttype = tally_type_from_name(prop)
+            if ttype is None:
                 continue
-            ttype = TallyType.from_str(prop)
             pixel = self.tally_type_map.get(tally.id + (ttype,))
             color = self.get_merged_tally(tally, ttype)
             if color == self.get(pixel):
@@ -235,9 +236,9 @@ class Matrix(Base, namespace='Matrix', final=True):
                 break
 
     async def queue_update(self, *keys):
-        coros = set()
+        coros = []
         for key in keys:
-            coros.add(self.update_queue.put(key))
+            coros.append(self.update_queue.put(key))
         if len(coros):
             await asyncio.gather(*coros)
 
@@ -4,6 +4,7 @@ import asyncio
 from dataclasses import dataclass
 from typing import Optional, Tuple, Iterable, Set, Dict, Union
 
+from pydispatch import Dispatcher
 from tslumd import UmdSender, TallyType, Screen, Tally, TallyKey
 from tslumd.sender import Client
 
@@ -52,7 +53,7 @@ ClientOrData = Union[Client, ClientData]
 INDICATOR_PROPS = {tt.name: tt for tt in TallyType.all()}
 
 
-class UmdOutput(BaseOutput, namespace='umd.UmdOutput', final=True):
+class UmdOutput(BaseOutput, Dispatcher, namespace='umd.UmdOutput', final=True):
     """Networked tally output using the UMDv5 protocol
 
     Arguments:
@@ -1,5 +1,61 @@
+import dataclasses
+from typing import Iterable
+
 from pydispatch.properties import Property, Observable
 
+def add_slots(*extra_slots: Iterable[str]):
+    """Class decorator to rebuild a :func:`~dataclasses.dataclass` with
+    ``__slots__`` for its fields
+
+    This is the equivalent of ``@dataclass(slots=True)`` (only available in
+    Python 3.10+). It must be applied *after* (above) the
+    :func:`~dataclasses.dataclass` decorator.
+
+    Arguments:
+        *extra_slots: Names of any non-field attributes set on instances
+            (such as cached values or :class:`~dataclasses.InitVar` names)
+
+    Slots already defined by a base class are not repeated, so the base
+    classes should be slotted as well (even if empty) for instances to
+    have no ``__dict__``.
+    """
+    def wrap(cls):
+        inherited = set()
+        for base in cls.__mro__[1:]:
+            inherited.update(base.__dict__.get('__slots__', ()))
+        names = [f.name for f in dataclasses.fields(cls)]
+        names.extend(extra_slots)
+        slots = tuple(n for n in names if n not in inherited)
+        cls_dict = dict(cls.__dict__)
+        cls_dict['__slots__'] = slots
+        for name in slots:
+            # Remove the field defaults (the generated __init__ has its own copy)
+            cls_dict.pop(name, None)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+        new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        new_cls.__qualname__ = cls.__qualname__
+        for obj in cls_dict.values():
+            _update_class_cell(obj, cls, new_cls)
+        return new_cls
+    return wrap
+
+def _update_class_cell(obj, old_cls, new_cls):
+    # Point the "__class__" closure of any method using the zero-argument form
+    # of super() to the rebuilt class
+    if isinstance(obj, (classmethod, staticmethod)):
+        obj = obj.__func__
+    elif isinstance(obj, property):
+        for f in (obj.fget, obj.fset, obj.fdel):
+            _update_class_cell(f, old_cls, new_cls)
+        return
+    code = getattr(obj, '__code__', None)
+    if code is None or obj.__closure__ is None:
+        return
+    for name, cell in zip(code.co_freevars, obj.__closure__):
+        if name == '__class__' and cell.cell_contents is old_cls:
+            cell.cell_contents = new_cls
+
 class SetProperty(Property):
     """Property with a :class:`set` type value
 
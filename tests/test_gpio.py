@@ -1,4 +1,5 @@
 import asyncio
+import weakref
 import pytest
 
 from tslumd import TallyType, TallyColor, Tally, Screen
@@ -93,3 +94,179 @@ async def test_color_merge(fake_gpio):
 
                 assert output.get_merged_tally(tally_key, tally_type) == TallyColor.OFF
                 assert not output.led.is_active
+
+@pytest.mark.asyncio
+async def test_unbind(fake_gpio):
+    from tallypi.common import SingleTallyConfig
+    from tallypi.inputs.gpio import GpioInput
+    from tallypi.outputs.gpio import LED
+
+    tally_key = (1, 1)
+    screen_index, tally_index = tally_key
+    tally_type = TallyType.rh_tally
+
+    inputs = {}
+    for i, name in enumerate(['a', 'b']):
+        conf = SingleTallyConfig(
+            screen_index=screen_index,
+            tally_index=tally_index,
+            tally_type=tally_type,
+        )
+        inp = GpioInput(conf, i + 10)
+        inp.id = f'Gpio.{name}'
+        inputs[name] = inp
+    output = LED(SingleTallyConfig(
+        screen_index=screen_index,
+        tally_index=tally_index,
+        tally_type=tally_type,
+    ), 20)
+
+    async with inputs['a'], inputs['b'], output:
+        for inp in inputs.values():
+            await output.bind_to_input(inp)
+        assert output.bound_input_tally_keys == {tally_key: {inputs['a'], inputs['b']}}
+        assert len(list(output.get_all_input_tallies(tally_key))) == 2
+
+        await output.unbind_from_input(inputs['a'])
+        assert output.bound_input_tally_keys == {tally_key: {inputs['b']}}
+        assert set(output.bound_inputs.keys()) == {'Gpio.b'}
+        assert [inp for inp, _ in output.get_all_input_tallies(tally_key)] == [inputs['b']]
+
+        await output.unbind_from_input(inputs['b'])
+        assert output.bound_input_tally_keys == {}
+        assert output.bound_inputs == {}
+        assert list(output.get_all_input_tallies(tally_key)) == []
+
+        await asyncio.gather(
+            output.bind_to_input(inputs['a']),
+            output.bind_to_input(inputs['a']),
+        )
+        assert output.bound_input_tally_keys == {tally_key: {inputs['a']}}
+        assert output._input_to_keys == {'Gpio.a': {tally_key}}
+
+@pytest.mark.asyncio
+async def test_input_events(fake_gpio):
+    from tallypi.common import SingleTallyConfig
+    from tallypi.inputs.gpio import GpioInput
+
+    loop = asyncio.get_event_loop()
+    conf = SingleTallyConfig(screen_index=1, tally_index=1, tally_type=TallyType.rh_tally)
+    inp = GpioInput(conf, 16)
+
+    class Listener:
+        def __init__(self):
+            self.added = []
+            self.updated = asyncio.Queue()
+        def on_tally_added(self, inp, tally, **kwargs):
+            self.added.append(tally)
+        async def on_tally_updated(self, inp, tally, props_changed, **kwargs):
+            await self.updated.put(props_changed)
+
+    listener = Listener()
+    inp.bind(on_tally_added=listener.on_tally_added)
+    inp.bind(on_tally_added=listener.on_tally_added)
+    inp.bind_async(loop, on_tally_updated=listener.on_tally_updated)
+    with pytest.raises(RuntimeError):
+        inp.bind(on_tally_updated=listener.on_tally_updated)
+
+    async with inp:
+        assert listener.added == [inp.tally]
+        inp._set_tally_state(True)
+        props_changed = await asyncio.wait_for(listener.updated.get(), 1)
+        assert list(props_changed) == ['rh_tally']
+        for _ in range(2):
+            assert inp.get_tally_color((1, 1), TallyType.rh_tally) == TallyColor.AMBER
+            assert inp.get_tally_color((1, 1), TallyType.all_tally) == TallyColor.AMBER
+            assert inp.get_tally_color((1, 1), TallyType.txt_tally) is None
+            assert inp.get_tally_color((1, 2), TallyType.rh_tally) is None
+
+        # In-place config changes are reflected
+        conf.color_mask = TallyColor.RED
+        assert inp.get_tally_color((1, 1), TallyType.rh_tally) == TallyColor.RED
+        conf.tally_type = TallyType.txt_tally
+        assert inp.get_tally_color((1, 1), TallyType.rh_tally) is None
+        conf.tally_type = TallyType.rh_tally
+        conf.color_mask = TallyColor.AMBER
+
+        inp._on_button_pressed(inp.button)
+        inp._on_button_released(inp.button)
+        props_changed = await asyncio.wait_for(listener.updated.get(), 1)
+        assert inp.tally.rh_tally == TallyColor.OFF
+        assert listener.updated.empty()
+        inp._on_button_released(inp.button)
+        await asyncio.sleep(.1)
+        assert listener.updated.empty()
+
+        inp.unbind(listener)
+        inp._set_tally_state(True)
+        await asyncio.sleep(.1)
+        assert listener.updated.empty()
+
+@pytest.mark.asyncio
+async def test_input_bind_unbind(fake_gpio):
+    import gc
+    from tallypi.common import SingleTallyConfig
+    from tallypi.inputs.gpio import GpioInput
+
+    class CustomInput(GpioInput):
+        _events_ = ['on_custom']
+
+    loop = asyncio.get_event_loop()
+    conf = SingleTallyConfig(screen_index=1, tally_index=1, tally_type=TallyType.rh_tally)
+    inp = CustomInput(conf, 16)
+    inp.register_event('on_registered')
+
+    results = []
+    aio_results = asyncio.Queue()
+
+    class Listener:
+        def on_custom(self, *args):
+            results.append(('custom', self, args))
+            return False
+        def on_registered(self, *args):
+            results.append(('registered', self, args))
+        async def on_custom_async(self, *args):
+            await aio_results.put(('custom', self, args))
+
+    def on_custom_func(*args):
+        results.append(('func', None, args))
+
+    a, b = Listener(), Listener()
+    inp.bind(on_custom=a.on_custom, on_registered=a.on_registered)
+    inp.bind(on_custom=on_custom_func)
+    inp.bind_async(loop, on_custom=a.on_custom_async)
+    with pytest.raises(KeyError):
+        inp.bind(on_unknown=a.on_custom)
+
+    # Coroutines are scheduled even though a sync callback stops the emission
+    assert inp.emit('on_custom', 1) is False
+    assert results == [('custom', a, (1,))]
+    assert await asyncio.wait_for(aio_results.get(), 1) == ('custom', a, (1,))
+    results.clear()
+
+    inp.emit('on_registered', 2)
+    assert results == [('registered', a, (2,))]
+    results.clear()
+
+    # Unbind by instance
+    inp.bind(on_custom=b.on_custom)
+    inp.unbind(a)
+    inp.emit('on_custom', 3)
+    assert results == [('func', None, (3,)), ('custom', b, (3,))]
+    await asyncio.sleep(.1)
+    assert aio_results.empty()
+    results.clear()
+
+    # Unbind by callback
+    inp.unbind(on_custom_func)
+    inp.emit('on_custom', 4)
+    assert results == [('custom', b, (4,))]
+    results.clear()
+
+    # Listeners are weakly referenced
+    b_ref = weakref.ref(b)
+    del b
+    gc.collect()
+    assert b_ref() is None
+    inp.emit('on_custom', 5)
+    assert results == []
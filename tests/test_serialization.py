@@ -1,4 +1,5 @@
 import json
+import pytest
 
 from tslumd import TallyType
 from tallypi.common import SingleTallyConfig, MultiTallyConfig
@@ -11,6 +12,31 @@ def test_single_tally(tally_conf_factory):
         deserialized = SingleTallyConfig.from_dict(d)
         assert orig_conf == deserialized
 
+    # Partial data falls back to the field defaults
+    d = {'tally_index':1, 'tally_type':'rh_tally'}
+    deserialized = SingleTallyConfig.from_dict(d)
+    assert deserialized == SingleTallyConfig(tally_index=1, tally_type=TallyType.rh_tally)
+    assert d == {'tally_index':1, 'tally_type':'rh_tally'}
+    with pytest.raises(TypeError):
+        SingleTallyConfig.from_dict({'tally_index':1, 'foo':2})
+    # Unknown keys with the same number of items as the fields
+    with pytest.raises(TypeError):
+        SingleTallyConfig.from_dict({
+            'tally_index':1, 'tally_type':'rh_tally', 'screen_index':None,
+            'name':'', 'foo':2,
+        })
+    with pytest.raises(TypeError):
+        MultiTallyConfig.from_dict({'tallies':[], 'allow_all':True, 'name':'', 'foo':2})
+    d = {'tallies':[d], 'allow_all':True}
+    deserialized = MultiTallyConfig.from_dict(d)
+    assert deserialized.allow_all
+    assert list(deserialized.tallies) == [SingleTallyConfig(tally_index=1, tally_type=TallyType.rh_tally)]
+
+    # Both paths use the same defaults
+    d = {'tally_index':1}
+    deserialized = MultiTallyConfig.from_dict({'tallies':[d]})
+    assert list(deserialized.tallies) == [SingleTallyConfig.from_dict(d)]
+
 def test_multi_tally(tally_conf_factory):
     orig_conf = MultiTallyConfig(allow_all=True)
     d = orig_conf.to_dict()
@@ -23,4 +49,174 @@ def test_multi_tally(tally_conf_factory):
 
     d = orig_conf.to_dict()
     d = json.loads(json.dumps(d))
-    assert MultiTallyConfig.from_dict(d) == orig_conf
+    deserialized = MultiTallyConfig.from_dict(d)
+    assert deserialized == orig_conf
+    assert list(deserialized.tallies) == list(orig_conf.tallies)
+
+    orig_conf = MultiTallyConfig(allow_all=True, screen_index=2, name='foo')
+    d = json.loads(json.dumps(orig_conf.to_dict()))
+    deserialized = MultiTallyConfig.from_dict(d)
+    assert deserialized == orig_conf
+    assert deserialized.screen_index == 2
+    assert deserialized.name == 'foo'
+
+def test_io_serialize(tally_conf_factory):
+    from tallypi.outputs.umd import UmdOutput
+
+    obj = UmdOutput(MultiTallyConfig(allow_all=True), clients=[('127.0.0.1', 65000)])
+    d = obj.serialize()
+    assert obj.serialize() == d
+    assert list(d['options']) == ['config', 'clients', 'all_off_on_close']
+    assert d['options']['clients'] == [{'hostaddr':'127.0.0.1', 'hostport':65000}]
+
+    obj.add_client(('127.0.0.1', 65001))
+    d = obj.serialize()
+    assert obj.serialize() == d
+    assert len(d['options']['clients']) == 2
+
+    obj.all_off_on_close = True
+    d = obj.serialize()
+    assert d['options']['all_off_on_close'] is True
+
+    conf = MultiTallyConfig()
+    for tconf in tally_conf_factory(10):
+        conf.tallies.append(tconf)
+    obj.config = conf
+    d = obj.serialize()
+    assert obj.serialize() == d
+    assert len(d['options']['config']['tallies']) == 10
+
+    # In-place changes to the config are included
+    conf.tallies.append(SingleTallyConfig(tally_index=100, tally_type=TallyType.rh_tally))
+    d = obj.serialize()
+    assert len(d['options']['config']['tallies']) == 11
+    conf.allow_all = True
+    assert obj.serialize()['options']['config']['allow_all'] is True
+    del conf.tallies[-1]
+    conf.allow_all = False
+    d = obj.serialize()
+    assert len(d['options']['config']['tallies']) == 10
+
+    opts = UmdOutput._get_cached_init_options()
+    assert UmdOutput._get_cached_init_options() is opts
+    assert [opt.name for opt in opts] == [opt.name for opt in UmdOutput.get_init_options()]
+    validators, serializers = UmdOutput._get_option_callbacks()
+    assert UmdOutput._get_option_callbacks()[0] is validators
+    assert list(validators) == [s[0] for s in serializers] == [opt.name for opt in opts]
+
+    obj2 = UmdOutput.deserialize(d)
+    assert obj2.serialize() == d
+
+def test_io_serialize_attrs(fake_gpio):
+    from tallypi.outputs.gpio import PWMLED
+    from tallypi.outputs.rgbmatrix5x5 import Indicator
+
+    conf = SingleTallyConfig(tally_index=1, tally_type=TallyType.rh_tally)
+    led = PWMLED(conf, 5)
+    assert led.serialize()['options']['brightness_scale'] == 1.0
+    led.brightness_scale = .5
+    led.active_high = False
+    led.pin = 6
+    opts = led.serialize()['options']
+    assert opts['brightness_scale'] == .5
+    assert opts['active_high'] is False
+    assert opts['pin'] == 6
+
+    ind = Indicator(conf)
+    assert ind.serialize()['options']['brightness_scale'] == 1.0
+    ind.brightness_scale = .5
+    assert ind.serialize()['options']['brightness_scale'] == .5
+
+def test_namespaces(monkeypatch):
+    from tallypi.baseio import BaseIO, BaseInput, BaseOutput
+
+    # Classes defined here are only registered in copies of the registry
+    monkeypatch.setattr(BaseIO, '_BaseIO__subclass_map', BaseIO._BaseIO__subclass_map.copy())
+    monkeypatch.setattr(BaseIO, '_BaseIO__sorted_namespaces', BaseIO._BaseIO__sorted_namespaces.copy())
+
+    all_ns = list(BaseIO.get_all_namespaces())
+    assert all_ns == sorted(all_ns)
+    assert 'input.umd.UmdInput' in all_ns
+    assert 'output.gpio.LED' in all_ns
+
+    assert list(BaseInput.get_all_namespaces()) == all_ns
+    in_ns = list(BaseIO.get_all_namespaces('input'))
+    assert in_ns == [ns for ns in all_ns if ns.startswith('input')]
+    assert list(BaseOutput.get_all_namespaces('output.gp')) == [
+        ns for ns in all_ns if ns.startswith('output.gp')
+    ]
+    for ns in all_ns:
+        cls = BaseIO.get_class_for_namespace(ns)
+        assert cls.namespace == ns
+        assert BaseOutput.get_class_for_namespace(ns) is cls
+
+    class NsTestOutput(BaseOutput, namespace='nstest.NsTestOutput', final=True):
+        pass
+
+    assert 'output.nstest.NsTestOutput' in BaseIO.get_all_namespaces('output')
+    assert BaseIO.get_class_for_namespace('output.nstest.NsTestOutput') is NsTestOutput
+    all_ns = list(BaseIO.get_all_namespaces())
+    assert all_ns == sorted(all_ns)
+    assert list(BaseIO.get_all_namespaces('output.nonexistent')) == []
+
+def test_enum_strings():
+    from tslumd import TallyColor
+    from tallypi.common import TallyColorOption
+
+    ttype_opt = SingleTallyConfig.get_init_options()[1]
+    assert ttype_opt.name == 'tally_type'
+    for v in range(TallyType.all_tally + 1):
+        tally_type = TallyType(v)
+        s = ttype_opt.serialize(tally_type)
+        assert s == tally_type.to_str()
+        assert ttype_opt.validate(s) is TallyType.from_str(s)
+    for color in [TallyColor.OFF, TallyColor.RED, TallyColor.GREEN, TallyColor.AMBER]:
+        s = TallyColorOption.serialize(color)
+        assert s == color.to_str()
+        assert TallyColorOption.validate(s) is color
+        assert TallyColorOption.validate(s.lower()) is color
+
+def test_option_validate():
+    from tallypi.config import (
+        Option, ListOption, RequiredError, ChoiceError, InvalidTypeError,
+    )
+
+    opt = Option(name='foo', type=str, choices=('a', 'b'))
+    assert opt.validate('a') == 'a'
+    with pytest.raises(ChoiceError):
+        opt.validate('c')
+    with pytest.raises(ChoiceError):
+        opt.validate(['a'])
+    with pytest.raises(RequiredError):
+        opt.validate(None)
+
+    opt = Option(name='foo', type=int, required=False)
+    assert opt.validate(None) is None
+    assert opt.validate(1) == 1
+    with pytest.raises(InvalidTypeError):
+        opt.validate('1')
+
+    opt = Option(name='foo', type=str, validate_cb=str.upper, serialize_cb=str.lower)
+    assert opt.validate('a') == 'A'
+    assert opt.serialize('A') == 'a'
+
+    opt = ListOption(
+        name='tallies', type=SingleTallyConfig,
+        sub_options=SingleTallyConfig.get_init_options(),
+    )
+    data = [{'tally_index':1, 'tally_type':'rh_tally'}, {'tally_index':2, 'tally_type':'txt_tally'}]
+    tallies = opt.validate(data)
+    assert tallies == [
+        SingleTallyConfig(tally_index=1, tally_type=TallyType.rh_tally),
+        SingleTallyConfig(tally_index=2, tally_type=TallyType.txt_tally),
+    ]
+    serialized = opt.serialize(tallies)
+    assert [d['tally_type'] for d in serialized] == ['rh_tally', 'txt_tally']
+    assert opt.validate(serialized) == tallies
+    with pytest.raises(RequiredError):
+        opt.validate([{'tally_type':'rh_tally'}])
+
+    for opt in [Option(name='foo', type=str), opt]:
+        assert not hasattr(opt, '__dict__')
+        with pytest.raises(AttributeError):
+            opt.foo = 1
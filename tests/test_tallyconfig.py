@@ -1,6 +1,8 @@
+import copy
+import pickle
 import pytest
 
-from tslumd import TallyType, TallyKey, Tally
+from tslumd import TallyType, TallyKey, Tally, Screen
 from tallypi.common import SingleTallyConfig, MultiTallyConfig
 
 @pytest.fixture
@@ -86,6 +88,21 @@ def test_single_tally_matching():
             assert not tconf0.matches(tconf2)
             assert not tconf0.matches(tconf2.id, tconf2.tally_type)
 
+    tconf = SingleTallyConfig(screen_index=1, tally_index=1, tally_type=tally_type)
+    assert not tconf.matches((2, 2))
+    tconf.screen_index = 2
+    assert not tconf.matches((2, 2))
+    tconf.tally_index = 2
+    assert tconf.matches((2, 2))
+    assert not tconf.matches_screen(1)
+    assert tconf.tally_key == (2, 2)
+    tconf.screen_index = 0xffff
+    assert tconf.matches_screen(1)
+    assert tconf.matches((1, 2))
+    tconf.screen_index = None
+    tconf.tally_index = None
+    assert tconf.tally_key == (0xffff, 0xffff)
+
 def test_multi_tally_matching():
     tally_type = TallyType.rh_tally
     for i in range(10):
@@ -150,6 +167,97 @@ def test_multi_tally_matching():
                 assert not allow_all_single_scr.matches(tconf0)
 
 
+def test_multi_tally_search(faker):
+    tally_types = [TallyType.rh_tally, TallyType.txt_tally, TallyType.lh_tally]
+    screens = [None, 0xffff, 1, 2]
+    indices = [None, 0xffff, 1, 2, 3]
+
+    tconfs = []
+    for _ in range(60):
+        tconfs.append(SingleTallyConfig(
+            screen_index=faker.random_element(screens),
+            tally_index=faker.random_element(indices),
+            tally_type=faker.random_element(tally_types),
+        ))
+    mconf = MultiTallyConfig(tallies=tconfs[:30])
+
+    def linear_search(tally, tally_type):
+        for t in mconf.tallies:
+            if t.matches(tally, tally_type):
+                return t
+
+    def check_all():
+        for scr in [0xffff, 1, 2, 3]:
+            for ix in [0xffff, 1, 2, 3, 4]:
+                for ttype in tally_types + [TallyType.all_tally]:
+                    expected = linear_search((scr, ix), ttype)
+                    assert mconf._search_tallies((scr, ix), ttype) is expected
+                    tconf = SingleTallyConfig(screen_index=scr, tally_index=ix, tally_type=ttype)
+                    expected = linear_search(tconf, ttype)
+                    assert mconf._search_tallies(tconf, ttype) is expected
+
+    check_all()
+    mconf.tallies.extend(tconfs[30:])
+    check_all()
+    del mconf.tallies[:20]
+    check_all()
+
+    # Operations that are not simple appends or removals, followed by appends
+    mconf.tallies.insert(0, tconfs[0])
+    mconf.tallies.pop()
+    mconf.tallies.append(tconfs[1])
+    check_all()
+    mconf.tallies.pop(0)
+    mconf.tallies.append(tconfs[2])
+    check_all()
+    mconf.tallies.reverse()
+    mconf.tallies.append(tconfs[3])
+    check_all()
+    mconf.tallies.sort(key=lambda t: t.tally_type)
+    mconf.tallies.extend(tconfs[4:8])
+    check_all()
+    mconf.tallies[0] = tconfs[8]
+    mconf.tallies.append(tconfs[9])
+    check_all()
+    for i, (_, t) in enumerate(sorted(
+        item for items in mconf.tallies_by_key.values() for item in items
+    )):
+        assert mconf.tallies[i] is t
+
+    # Replacing the list
+    mconf.tallies = tconfs[10:40]
+    check_all()
+    mconf.tallies.append(tconfs[40])
+    check_all()
+
+def test_multi_tally_child_edits():
+    tconfs = [
+        SingleTallyConfig(screen_index=1, tally_index=i, tally_type=TallyType.all_tally)
+        for i in range(4)
+    ]
+    mconf = MultiTallyConfig(tallies=tconfs)
+    t = tconfs[1]
+    assert mconf.contains((1, 1), return_matched=True) is t
+    assert not mconf.contains((1, 5))
+    assert not mconf.contains(
+        SingleTallyConfig(screen_index=1, tally_index=5, tally_type=TallyType.txt_tally)
+    )
+
+    t.tally_index = 5
+    assert mconf.contains((1, 5), return_matched=True) is t
+    assert not mconf.contains((1, 1))
+    assert mconf.tallies_by_key[(1, 5)] == [(1, t)]
+    assert (1, 1) not in mconf.tallies_by_key
+
+    t.screen_index = None
+    assert mconf.contains((2, 5), return_matched=True) is t
+    t.tally_type = TallyType.txt_tally
+    assert not mconf.contains((2, 5), TallyType.rh_tally)
+    assert mconf.contains((2, 5), TallyType.txt_tally, return_matched=True) is t
+    assert mconf.contains(
+        SingleTallyConfig(screen_index=1, tally_index=5, tally_type=TallyType.txt_tally)
+    )
+
 def test_single_tally_type_matching(matched_sconfs, unmatched_sconfs):
     all_match = SingleTallyConfig(
         screen_index=0,
@@ -301,3 +409,196 @@ def test_memoization():
             assert match == sconf2
 
     assert mconf0.memoized_tally_confs == mconf1.memoized_tally_confs
+
+    # Misses are memoized until the tallies change
+    for _ in range(2):
+        assert not mconf1.matches((8, 1))
+        assert not mconf1.matches(SingleTallyConfig(screen_index=8, tally_index=1))
+    conf = SingleTallyConfig(screen_index=8, tally_index=1, tally_type=TallyType.rh_tally)
+    mconf1.tallies.append(conf)
+    assert mconf1.matches((8, 1), return_matched=True) is conf
+    assert not mconf1.matches((8, 1), TallyType.txt_tally)
+
+    # Appending keeps the memoized matches, removal only drops its own
+    memo = mconf1.memoized_tally_confs
+    mconf1.tallies.append(SingleTallyConfig(screen_index=9, tally_index=1))
+    assert mconf1.memoized_tally_confs is memo
+    assert conf.id in memo
+    first = mconf1.tallies[0]
+    assert mconf1.matches(first, return_matched=True) is first
+    mconf1.tallies.remove(conf)
+    assert mconf1.memoized_tally_confs is memo
+    assert conf.id not in memo
+    assert mconf1.search_memoized(first) is first
+    assert not mconf1.matches((8, 1))
+
+    # Replacing an item clears everything
+    mconf1.tallies[0] = conf
+    assert mconf1.search_memoized(first) is None
+    assert mconf1.matches((8, 1), return_matched=True) is conf
+
+    # As does changing any of the fields
+    mconf = MultiTallyConfig(allow_all=True)
+    assert mconf.contains((3, 3), return_matched=True)
+    mconf.allow_all = False
+    assert not mconf.contains((3, 3))
+
+def test_io_match_cache():
+    from tallypi.outputs.umd import UmdOutput
+
+    mconf = MultiTallyConfig(tallies=[
+        SingleTallyConfig(screen_index=1, tally_index=1, tally_type=TallyType.rh_tally),
+    ])
+    obj = UmdOutput(mconf)
+    sconf = mconf.tallies[0]
+
+    for _ in range(2):
+        assert obj.tally_matches((1, 1))
+        assert obj.tally_matches((1, 1), TallyType.rh_tally, return_matched=True) is sconf
+        assert not obj.tally_matches((1, 1), TallyType.txt_tally)
+        assert not obj.tally_matches((1, 2))
+
+    screen, tally = SingleTallyConfig(screen_index=1, tally_index=2).create_tally()
+    assert not obj.tally_matches(tally)
+
+    # In-place changes to the config are reflected
+    mconf.tallies.append(SingleTallyConfig(screen_index=1, tally_index=2, tally_type=TallyType.rh_tally))
+    assert obj.tally_matches((1, 2))
+    assert obj.tally_matches(tally)
+
+    obj.config = MultiTallyConfig(allow_all=True)
+    assert obj.tally_matches((1, 2))
+    assert obj.tally_matches((1, 1), TallyType.txt_tally)
+    assert obj.tally_matches(tally)
+
+    obj.config = MultiTallyConfig(allow_all=True, screen_index=1)
+    for _ in range(2):
+        assert obj.screen_matches(1)
+        assert obj.screen_matches(Screen(1))
+        assert not obj.screen_matches(2)
+        assert not obj.screen_matches(Screen(2))
+        assert obj.screen_matches(Screen.broadcast())
+
+    obj.config = MultiTallyConfig(allow_all=True, screen_index=2)
+    assert not obj.screen_matches(1)
+    assert obj.screen_matches(Screen(2))
+
+    obj.config.screen_index = 1
+    assert obj.screen_matches(1)
+    assert not obj.screen_matches(Screen(2))
+
+def test_slots():
+    tconf = SingleTallyConfig(tally_index=1, tally_type=TallyType.rh_tally)
+    assert not hasattr(tconf, '__dict__')
+    with pytest.raises(AttributeError):
+        tconf.foo = 'bar'
+    assert tconf.is_broadcast_screen
+    assert not tconf.is_broadcast_tally
+    tconf.screen_index = 2
+    assert tconf.tally_key == (2, 1)
+    assert not tconf.is_broadcast_screen
+
+    assert tconf == SingleTallyConfig(screen_index=2, tally_index=1, tally_type=TallyType.rh_tally)
+    assert tconf != SingleTallyConfig(screen_index=None, tally_index=1, tally_type=TallyType.rh_tally)
+    assert tconf != SingleTallyConfig(screen_index=2, tally_index=1, tally_type=TallyType.rh_tally, name='a')
+    assert tconf != (2, 1)
+
+    d = tconf.to_dict()
+    assert d['tally_type'] == 'rh_tally'
+    assert tconf.to_dict() == d
+    tconf.tally_type = TallyType.rh_tally | TallyType.lh_tally
+    assert tconf.to_dict()['tally_type'] == 'rh_tally|lh_tally'
+    tconf.name = 'foo'
+    assert tconf.to_dict()['name'] == 'foo'
+    tconf.name = ''
+
+    # Changes to the returned dicts do not affect the cached one
+    d = tconf.to_dict()
+    d['tally_index'] = 100
+    assert tconf.to_dict()['tally_index'] == 1
+    multi_d = MultiTallyConfig(tallies=[tconf]).to_dict()
+    multi_d['tallies'][0]['name'] = 'bar'
+    assert tconf.to_dict()['name'] == ''
+
+    # The tally types must overlap the other config and tally_type separately
+    other = SingleTallyConfig(screen_index=2, tally_index=1, tally_type=TallyType.rh_tally)
+    assert tconf.matches(other, TallyType.lh_tally)
+    assert not tconf.matches(other, TallyType.txt_tally)
+
+    multi = MultiTallyConfig(tallies=[tconf])
+    assert not hasattr(multi, '__dict__')
+    assert multi.contains(tconf)
+    multi.tallies.append(SingleTallyConfig(tally_index=3, tally_type=TallyType.lh_tally))
+    assert multi.contains(SingleTallyConfig(tally_index=3, tally_type=TallyType.lh_tally))
+
+@pytest.mark.parametrize('copy_func', [
+    copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj)),
+])
+def test_copy(copy_func):
+    tconf = SingleTallyConfig(
+        screen_index=2, tally_index=1, tally_type=TallyType.rh_tally, name='a',
+    )
+    tconf.to_dict()
+    c = copy_func(tconf)
+    assert c is not tconf
+    assert c == tconf
+    assert c.tally_key == (2, 1)
+    assert c.to_dict() == tconf.to_dict()
+    c.tally_index = 3
+    assert c.tally_key == (2, 3)
+    assert c.to_dict()['tally_index'] == 3
+    assert tconf.tally_key == (2, 1)
+
+    multi = MultiTallyConfig(tallies=[tconf], screen_index=2, name='b')
+    assert multi.contains((2, 1))
+    c = copy_func(multi)
+    assert c is not multi
+    assert c == multi
+    assert c.to_dict() == multi.to_dict()
+    assert c.contains((2, 1))
+    c.tallies.append(SingleTallyConfig(screen_index=2, tally_index=4, tally_type=TallyType.rh_tally))
+    assert c.contains((2, 4))
+    assert len(multi.tallies) == 1
+    assert not multi.contains((2, 4))
+
+def test_defaults():
+    import dataclasses
+    tconf = SingleTallyConfig(1)
+    for f in dataclasses.fields(SingleTallyConfig):
+        if f.default is not dataclasses.MISSING:
+            assert getattr(tconf, f.name) == f.default
+    assert SingleTallyConfig.from_dict({'tally_index':1}) == tconf
+
+def test_from_tally():
+    for scr, ix in [(1, 2), (None, 2), (1, None), (None, None)]:
+        screen, tally = SingleTallyConfig(screen_index=scr, tally_index=ix).create_tally()
+        tconf = SingleTallyConfig.from_tally(tally)
+        assert tconf.screen_index == scr
+        assert tconf.tally_index == ix
+        assert tconf.tally_type == TallyType.all_tally
+        assert tconf.matches(tally)
+    tconf = SingleTallyConfig.from_tally(tally, tally_type=TallyType.rh_tally, name='foo')
+    assert tconf.tally_type == TallyType.rh_tally
+    assert tconf.name == 'foo'
+
+def test_tally_normalize_cache():
+    import gc
+    from tallypi import common
+
+    for scr, ix in [(1, 2), (None, 2), (1, None), (None, None)]:
+        screen, tally = SingleTallyConfig(screen_index=scr, tally_index=ix).create_tally()
+        for _ in range(2):
+            assert common.normalize_screen(tally) == scr
+            assert common.normalize_tally_index(tally) == ix
+        assert id(tally) in common._TALLY_NORM_CACHE
+        key = id(tally)
+        del tally, screen
+        gc.collect()
+        assert key not in common._TALLY_NORM_CACHE
+
+def test_tally_type_from_name():
+    from tallypi.common import tally_type_from_name
+    for ttype in TallyType:
+        assert tally_type_from_name(ttype.name) is ttype
+    assert tally_type_from_name('rh_tally|txt_tally') is None
+    assert tally_type_from_name('foo') is None